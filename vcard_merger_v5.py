@@ -18,11 +18,74 @@ Key Features:
 
 import re
 import json
+import mmap
 import os
-from collections import defaultdict
+import sys
+from collections import defaultdict, deque, namedtuple
+from itertools import groupby
+from operator import itemgetter
 from difflib import SequenceMatcher
+from functools import lru_cache
 import threading
-import queue
+from concurrent.futures import ThreadPoolExecutor
+
+# RapidFuzz (C/SIMD string matching) is optional - fall back to difflib
+try:
+    from rapidfuzz import fuzz as _rf_fuzz
+except ImportError:
+    _rf_fuzz = None
+
+# rapidfuzz.process.cdist needs numpy for its result matrix
+try:
+    from rapidfuzz import process as _rf_process
+    import numpy as _np
+except ImportError:
+    _rf_process = None
+    _np = None
+
+
+if _rf_fuzz is not None:
+    def _ratio(a, b):
+        """Similarity ratio in [0, 1] between two strings."""
+        return _rf_fuzz.ratio(a, b) / 100.0
+
+    def _token_sort_ratio(a, b):
+        """Word-order-insensitive similarity in [0, 1] (for full names)."""
+        return _rf_fuzz.token_sort_ratio(a, b) / 100.0
+else:
+    # One reusable matcher with autojunk disabled: autojunk skews ratios on
+    # repetitive strings, and reusing the instance lets difflib keep its
+    # second-sequence index between calls
+    _SM = SequenceMatcher(autojunk=False)
+
+    def _ratio(a, b):
+        """Similarity ratio in [0, 1] between two strings."""
+        _SM.set_seq2(b)
+        _SM.set_seq1(a)
+        return _SM.ratio()
+
+    _token_sort_ratio = _ratio
+
+
+def _similarity(a, b, threshold=0.0):
+    """
+    Similarity in [0, 1] with identical-input and length prefilters.
+
+    threshold is the caller's decision bar: the ratio can never exceed
+    2*min_len / (min_len + max_len) because each edit costs at least one
+    length unit, so when that bound already falls below the threshold the
+    matcher is skipped and 0.0 returned. Exact for both rapidfuzz ratio
+    and difflib, which share the 2M/T formula.
+    """
+    if a == b:
+        return 1.0
+    if threshold:
+        la, lb = len(a), len(b)
+        if la > lb:
+            la, lb = lb, la
+        if 2 * la < threshold * (la + lb):
+            return 0.0
+    return _ratio(a, b)
 
 # Delay tkinter import until GUI is actually needed
 tk = None
@@ -30,21 +93,19 @@ filedialog = None
 messagebox = None
 ttk = None
 scrolledtext = None
-simpledialog = None
 
 def _import_tkinter():
     """Import tkinter on demand for GUI components"""
-    global tk, filedialog, messagebox, ttk, scrolledtext, simpledialog
+    global tk, filedialog, messagebox, ttk, scrolledtext
     if tk is None:
         import tkinter as _tk
         from tkinter import filedialog as _fd, messagebox as _mb, ttk as _ttk
-        from tkinter import scrolledtext as _st, simpledialog as _sd
+        from tkinter import scrolledtext as _st
         tk = _tk
         filedialog = _fd
         messagebox = _mb
         ttk = _ttk
         scrolledtext = _st
-        simpledialog = _sd
 
 
 def create_color_button(parent, text, command, bg_color, fg_color='white',
@@ -228,13 +289,17 @@ NICKNAME_MAP = {
     'wendy': 'gwendolyn', 'gwen': 'gwendolyn',
 }
 
-# Build canonical name lookup (both directions)
+# Build canonical name lookup (both directions). Keys and values are
+# interned so every lookup compares against strings with cached hashes and
+# downstream bucket keys share one allocation per distinct name.
 CANONICAL_NAMES = {}
 for nickname, canonical in NICKNAME_MAP.items():
-    CANONICAL_NAMES[nickname] = canonical
+    canonical = sys.intern(canonical)
+    CANONICAL_NAMES[sys.intern(nickname)] = canonical
     CANONICAL_NAMES[canonical] = canonical
 
 
+@lru_cache(maxsize=65536)
 def resolve_nickname(name):
     """
     Resolve a name to its canonical form.
@@ -245,13 +310,26 @@ def resolve_nickname(name):
     """
     if not name:
         return ''
-    return CANONICAL_NAMES.get(name.lower(), name.lower())
+    key = sys.intern(name.lower())
+    return CANONICAL_NAMES.get(key, key)
 
 
 # ============================================================================
 # SOUNDEX IMPLEMENTATION - Phonetic matching
 # ============================================================================
 
+# Flat ASCII lookup table (letter ordinal -> soundex digit) - one list index
+# per character instead of a dict lookup in the encoding loop
+_SOUNDEX_LUT = [''] * 128
+for _letters, _digit in (('BFPV', '1'), ('CGJKQSXZ', '2'), ('DT', '3'),
+                         ('L', '4'), ('MN', '5'), ('R', '6'),
+                         ('AEIOUHWY', '0')):
+    for _ch in _letters:
+        _SOUNDEX_LUT[ord(_ch)] = _digit
+del _letters, _digit, _ch
+
+
+@lru_cache(maxsize=65536)
 def soundex(name):
     """
     Generate Soundex code for a name.
@@ -267,47 +345,55 @@ def soundex(name):
     if not name:
         return ""
 
-    # Convert to uppercase and keep only letters
-    name = ''.join(c for c in name.upper() if c.isalpha())
-    if not name:
-        return ""
-
-    # Keep first letter
-    first_letter = name[0]
-
-    # Map letters to numbers
-    mapping = {
-        'B': '1', 'F': '1', 'P': '1', 'V': '1',
-        'C': '2', 'G': '2', 'J': '2', 'K': '2', 'Q': '2', 'S': '2', 'X': '2', 'Z': '2',
-        'D': '3', 'T': '3',
-        'L': '4',
-        'M': '5', 'N': '5',
-        'R': '6',
-        'A': '0', 'E': '0', 'I': '0', 'O': '0', 'U': '0', 'H': '0', 'W': '0', 'Y': '0'
-    }
+    # Single pass: uppercase once, skip non-letters inline, and encode with
+    # the flat lookup table - no intermediate filtered string. The loop
+    # stops as soon as the 4-character code is complete.
+    lut = _SOUNDEX_LUT
+    coded = None
+    prev_code = '0'
 
-    # Convert rest of name
-    coded = first_letter
-    prev_code = mapping.get(first_letter, '0')
-
-    for char in name[1:]:
-        code = mapping.get(char, '')
-        if code and code != '0' and code != prev_code:
-            coded += code
+    for char in name.upper():
+        if not char.isalpha():
+            continue
+        o = ord(char)
+        code = lut[o] if o < 128 else ''
+
+        if coded is None:
+            # Keep the first letter verbatim
+            coded = [char]
+            prev_code = code or '0'
+        elif code and code != '0' and code != prev_code:
+            coded.append(code)
+            if len(coded) == 4:
+                break
             prev_code = code
         elif code == '0':
             prev_code = '0'  # Vowels reset the previous code
 
-    # Pad or truncate to 4 characters
-    coded = (coded + '000')[:4]
+    if coded is None:
+        return ""
 
-    return coded
+    # Pad to 4 characters
+    return (''.join(coded) + '000')[:4]
 
 
 # ============================================================================
 # NAME PARSING AND NORMALIZATION
 # ============================================================================
 
+# Precompiled patterns - avoids the re-cache lookup and flag handling that
+# re.sub pays on every call in the match loop
+_TITLES_START_RE = re.compile(r'^(dr|mr|mrs|ms|miss|prof|rev|hon|sir|dame)\.?\s+', re.IGNORECASE)
+_TITLES_AFTER_COMMA_RE = re.compile(r',\s*(dr|mr|mrs|ms|miss|prof|rev|hon|sir|dame)\.?\s+', re.IGNORECASE)
+_SUFFIXES_RE = re.compile(r',?\s*\b(jr|sr|ii|iii|iv|v|phd|md|esq|cpa|dds|dvm)\.?\s*$', re.IGNORECASE)
+_NAME_PUNCT_RE = re.compile(r'[^\w\s-]')
+
+# Translation table that deletes every ASCII non-digit; str.translate runs
+# the whole scan in C, well ahead of an equivalent regex substitution
+_NON_DIGIT_DELETE = str.maketrans(
+    '', '', ''.join(chr(c) for c in range(128) if not chr(c).isdigit()))
+
+@lru_cache(maxsize=65536)
 def parse_name_parts(full_name):
     """
     Parse a full name into (first_name, last_name, canonical_form) regardless of format.
@@ -334,13 +420,9 @@ def parse_name_parts(full_name):
     # Remove common titles (with word boundaries, case insensitive)
     # Note: Match titles that may or may not have a period after them
     # Also handle titles appearing after comma (e.g., "Smith, Dr. John")
-    titles_start = r'^(dr|mr|mrs|ms|miss|prof|rev|hon|sir|dame)\.?\s+'
-    titles_after_comma = r',\s*(dr|mr|mrs|ms|miss|prof|rev|hon|sir|dame)\.?\s+'
-    suffixes = r',?\s*\b(jr|sr|ii|iii|iv|v|phd|md|esq|cpa|dds|dvm)\.?\s*$'
-
-    name = re.sub(titles_start, '', full_name, flags=re.IGNORECASE)
-    name = re.sub(titles_after_comma, ', ', name, flags=re.IGNORECASE)
-    name = re.sub(suffixes, '', name, flags=re.IGNORECASE)
+    name = _TITLES_START_RE.sub('', full_name)
+    name = _TITLES_AFTER_COMMA_RE.sub(', ', name)
+    name = _SUFFIXES_RE.sub('', name)
     name = ' '.join(name.split())  # Clean up whitespace
 
     if not name:
@@ -372,8 +454,8 @@ def parse_name_parts(full_name):
     last_name = last_name.lower().strip()
 
     # Remove any punctuation from names
-    first_name = re.sub(r'[^\w\s-]', '', first_name)
-    last_name = re.sub(r'[^\w\s-]', '', last_name)
+    first_name = _NAME_PUNCT_RE.sub('', first_name)
+    last_name = _NAME_PUNCT_RE.sub('', last_name)
 
     # Create canonical form: always "firstname lastname" order
     if first_name and last_name:
@@ -385,9 +467,20 @@ def parse_name_parts(full_name):
     else:
         canonical = ''
 
-    return (first_name, last_name, canonical)
+    # Intern the parts: thousands of contacts share the same first/last
+    # names, so this collapses duplicate allocations and makes downstream
+    # equality checks and bucket-key hashing effectively pointer operations
+    return (sys.intern(first_name), sys.intern(last_name), sys.intern(canonical))
 
 
+# Precomputed name-matching keys for a contact: everything the pair-scoring
+# code needs, so a comparison is pure string/equality work with no parsing
+NameKeys = namedtuple('NameKeys', ['first', 'last', 'canonical',
+                                   'canonical_first', 'soundex_first',
+                                   'soundex_last'])
+
+
+@lru_cache(maxsize=65536)
 def get_canonical_first_name(first_name):
     """
     Get the canonical form of a first name (expand nicknames).
@@ -403,6 +496,7 @@ def get_canonical_first_name(first_name):
     return resolve_nickname(first_name)
 
 
+@lru_cache(maxsize=65536)
 def normalize_display_name(name):
     """
     Remove duplicate consecutive words from name.
@@ -458,19 +552,31 @@ def names_match(name1, name2, threshold=0.75):
     if canonical1 and canonical2 and canonical1 == canonical2:
         return (True, 100, ["Exact name match (canonical form)"])
 
+    # Early reject: wildly different lengths with no exact last-name or
+    # canonical-first agreement can't reach the match threshold, so skip
+    # the soundex/ratio work entirely
+    if (abs(len(canonical1) - len(canonical2)) > 6
+            and last1 != last2
+            and get_canonical_first_name(first1) != get_canonical_first_name(first2)):
+        return (False, 0, [])
+
     # Check last name match (most important)
     last_match = False
     last_confidence = 0
     if last1 and last2:
-        if last1 == last2:
+        # Interned strings make the identity check a cheap fast path
+        if last1 is last2 or last1 == last2:
             last_match = True
             last_confidence = 40
             reasons.append("Last name exact match")
+        elif abs(len(last1) - len(last2)) > 3:
+            # Length gap too large for a phonetic or edit-distance match
+            pass
         elif soundex(last1) == soundex(last2):
             last_match = True
             last_confidence = 30
             reasons.append(f"Last name phonetic match ({last1} ~ {last2})")
-        elif SequenceMatcher(None, last1, last2).ratio() > 0.85:
+        elif _ratio(last1, last2) > 0.85:
             last_match = True
             last_confidence = 25
             reasons.append(f"Last name similar ({last1} ~ {last2})")
@@ -490,7 +596,7 @@ def names_match(name1, name2, threshold=0.75):
             first_confidence = 35
             reasons.append(f"Nickname match ({first1} = {first2})")
         # Phonetic match - only if names are reasonably similar
-        elif soundex(first1) == soundex(first2) and SequenceMatcher(None, first1, first2).ratio() > 0.5:
+        elif soundex(first1) == soundex(first2) and _ratio(first1, first2) > 0.5:
             first_match = True
             first_confidence = 25
             reasons.append(f"First name phonetic match ({first1} ~ {first2})")
@@ -509,8 +615,12 @@ def names_match(name1, name2, threshold=0.75):
     # Both first and last must match for a name match
     is_match = first_match and last_match
 
-    # Bonus for very high string similarity on full name
-    full_sim = SequenceMatcher(None, canonical1, canonical2).ratio()
+    # Bonus for very high string similarity on full name (skip the ratio
+    # computation outright when the canonical forms are identical)
+    if canonical1 == canonical2:
+        full_sim = 1.0
+    else:
+        full_sim = _token_sort_ratio(canonical1, canonical2)
     if full_sim > 0.9:
         confidence += 10
         reasons.append(f"High overall similarity ({int(full_sim*100)}%)")
@@ -525,6 +635,7 @@ def names_match(name1, name2, threshold=0.75):
 # EMAIL NORMALIZATION
 # ============================================================================
 
+@lru_cache(maxsize=65536)
 def normalize_email(email):
     """
     Normalize email address for comparison.
@@ -541,18 +652,27 @@ def normalize_email(email):
     Returns:
         Normalized email address
     """
-    if not email or '@' not in email:
-        return email.lower() if email else ''
+    if not email:
+        return ''
 
-    local, domain = email.lower().rsplit('@', 1)
+    # Single lowercase pass, then slice on the rightmost @ - avoids the
+    # extra scans a contains-check plus rsplit/split would do
+    email = email.lower()
+    at = email.rfind('@')
+    if at < 0:
+        return email
+
+    local = email[:at]
+    domain = email[at + 1:]
 
     # Normalize domain (googlemail.com -> gmail.com)
     if domain == 'googlemail.com':
         domain = 'gmail.com'
 
     # Remove plus addressing
-    if '+' in local:
-        local = local.split('+')[0]
+    plus = local.find('+')
+    if plus >= 0:
+        local = local[:plus]
 
     # Remove dots for Gmail (Google ignores them)
     if domain == 'gmail.com':
@@ -561,6 +681,7 @@ def normalize_email(email):
     return f"{local}@{domain}"
 
 
+@lru_cache(maxsize=65536)
 def get_email_domain(email):
     """Extract domain from email, or empty string if invalid"""
     if not email or '@' not in email:
@@ -568,25 +689,30 @@ def get_email_domain(email):
     return email.lower().split('@')[-1]
 
 
+# Generic (non company-specific) email providers - built once at import
+# instead of on every is_generic_email_domain call
+GENERIC_EMAIL_DOMAINS = frozenset({
+    'gmail.com', 'googlemail.com', 'yahoo.com', 'yahoo.co.uk',
+    'hotmail.com', 'outlook.com', 'live.com', 'msn.com',
+    'icloud.com', 'me.com', 'mac.com',
+    'aol.com', 'protonmail.com', 'proton.me',
+    'mail.com', 'email.com', 'inbox.com',
+    'ymail.com', 'rocketmail.com',
+    'comcast.net', 'verizon.net', 'att.net', 'sbcglobal.net',
+    'earthlink.net', 'cox.net', 'charter.net',
+})
+
+
 def is_generic_email_domain(domain):
     """Check if email domain is a generic provider (not company-specific)"""
-    generic_domains = {
-        'gmail.com', 'googlemail.com', 'yahoo.com', 'yahoo.co.uk',
-        'hotmail.com', 'outlook.com', 'live.com', 'msn.com',
-        'icloud.com', 'me.com', 'mac.com',
-        'aol.com', 'protonmail.com', 'proton.me',
-        'mail.com', 'email.com', 'inbox.com',
-        'ymail.com', 'rocketmail.com',
-        'comcast.net', 'verizon.net', 'att.net', 'sbcglobal.net',
-        'earthlink.net', 'cox.net', 'charter.net',
-    }
-    return domain.lower() in generic_domains
+    return domain.lower() in GENERIC_EMAIL_DOMAINS
 
 
 # ============================================================================
 # PHONE NORMALIZATION
 # ============================================================================
 
+@lru_cache(maxsize=65536)
 def normalize_phone(phone):
     """
     Normalize phone number for comparison.
@@ -607,7 +733,12 @@ def normalize_phone(phone):
         return ''
 
     # Extract only digits
-    digits = re.sub(r'\D', '', phone)
+    digits = phone.translate(_NON_DIGIT_DELETE)
+    if digits and not digits.isdecimal():
+        # Non-ASCII characters survived the table - filter the slow way.
+        # isdecimal, not isdigit: superscripts and circled digits pass
+        # isdigit but are not int()-safe and \d never matched them
+        digits = ''.join(c for c in digits if c.isdecimal())
 
     if not digits:
         return ''
@@ -658,6 +789,17 @@ def phones_match(phone1, phone2):
 # VCARD CONTACT CLASS
 # ============================================================================
 
+# Folded (continuation) lines: newline followed by one space or tab
+_FOLD_RE = re.compile(r'\r?\n[ \t]')
+
+# Every supported property in one pattern: name, optional parameters,
+# value. Anchored at line start; 'N' sits last in the alternation so the
+# longer names win without backtracking
+_VCARD_PROP_RE = re.compile(
+    r'^(FN|EMAIL|TEL|ADR|NOTE|ORG|TITLE|BDAY|URL|N)(?:;[^:\n]*)?:(.+)$',
+    re.MULTILINE | re.IGNORECASE)
+
+
 class VCardContact:
     """Contact with full field preservation and enhanced matching"""
 
@@ -676,11 +818,22 @@ class VCardContact:
         self.raw_vcard = ''
         self.source_file = ''
 
+        # Parse-time membership sets so duplicate detection during parsing
+        # is O(1) instead of a linear scan over the lists
+        self._email_lc = set()
+        self._phone_set = set()
+        self._addr_set = set()
+        self._note_set = set()
+
         # Cached normalized values for faster matching
         self._normalized_name = None
         self._parsed_name = None
+        self._match_keys = None
         self._normalized_emails = None
         self._normalized_phones = None
+        self._org_lc = None
+        self._full_details = None
+        self._vcard_cache = None
 
     def parse_vcard(self, vcard_text):
         """
@@ -690,64 +843,80 @@ class VCardContact:
             vcard_text: Raw vCard text to parse
         """
         self.raw_vcard = vcard_text
-        lines = vcard_text.split('\n')
-        current_line = ''
-
-        for line in lines:
-            # Handle line continuation (folded lines)
-            if line.startswith(' ') or line.startswith('\t'):
-                current_line += line[1:]
-                continue
 
-            if current_line:
-                self._process_line(current_line)
-            current_line = line
-
-        if current_line:
-            self._process_line(current_line)
+        # Unfold continuation lines in one C-level regex pass, then pull all
+        # supported properties with a single compiled scan - no per-line
+        # Python splitting or key lookups for unsupported lines
+        unfolded = _FOLD_RE.sub('', vcard_text)
+        handlers = self._FIELD_HANDLERS
+        for match in _VCARD_PROP_RE.finditer(unfolded):
+            value = match.group(2).strip()
+            if value:
+                handlers[match.group(1).upper()](self, value)
 
         # Clear caches after parsing
         self._normalized_name = None
         self._parsed_name = None
+        self._match_keys = None
         self._normalized_emails = None
         self._normalized_phones = None
-
-    def _process_line(self, line):
-        """Process a single vCard line"""
-        if ':' not in line:
-            return
-
-        field, value = line.split(':', 1)
-        field = field.upper()
-        value = value.strip()
-
-        if not value:
-            return
-
-        if field.startswith('FN'):
-            self.fn = value
-        elif field.startswith('N') and not field.startswith('NOTE'):
-            self.n_parts = value.split(';')
-        elif field.startswith('EMAIL'):
-            if value.lower() not in [e.lower() for e in self.emails]:
-                self.emails.append(value)
-        elif field.startswith('TEL'):
-            if value not in self.phones:
-                self.phones.append(value)
-        elif field.startswith('ADR'):
-            if value not in self.addresses:
-                self.addresses.append(value)
-        elif field.startswith('NOTE'):
-            if value not in self.notes:
-                self.notes.append(value)
-        elif field.startswith('ORG'):
-            self.org = value
-        elif field.startswith('TITLE'):
-            self.title = value
-        elif field.startswith('BDAY'):
-            self.birthday = value
-        elif field.startswith('URL'):
-            self.url = value
+        self._org_lc = None
+        self._full_details = None
+        self._vcard_cache = None
+
+    def _set_fn(self, value):
+        self.fn = value
+
+    def _set_n(self, value):
+        self.n_parts = value.split(';')
+
+    def _add_email(self, value):
+        lc = value.lower()
+        if lc not in self._email_lc:
+            self._email_lc.add(lc)
+            self.emails.append(value)
+
+    def _add_phone(self, value):
+        if value not in self._phone_set:
+            self._phone_set.add(value)
+            self.phones.append(value)
+
+    def _add_address(self, value):
+        if value not in self._addr_set:
+            self._addr_set.add(value)
+            self.addresses.append(value)
+
+    def _add_note(self, value):
+        if value not in self._note_set:
+            self._note_set.add(value)
+            self.notes.append(value)
+
+    def _set_org(self, value):
+        self.org = value
+
+    def _set_title(self, value):
+        self.title = value
+
+    def _set_birthday(self, value):
+        self.birthday = value
+
+    def _set_url(self, value):
+        self.url = value
+
+    # One dict lookup per line instead of a startswith cascade; this also
+    # removes the fragile N / NOTE prefix disambiguation
+    _FIELD_HANDLERS = {
+        'FN': _set_fn,
+        'N': _set_n,
+        'EMAIL': _add_email,
+        'TEL': _add_phone,
+        'ADR': _add_address,
+        'NOTE': _add_note,
+        'ORG': _set_org,
+        'TITLE': _set_title,
+        'BDAY': _set_birthday,
+        'URL': _set_url,
+    }
 
     def get_normalized_name(self):
         """Get normalized name for matching (cached)"""
@@ -761,6 +930,17 @@ class VCardContact:
             self._parsed_name = parse_name_parts(self.fn)
         return self._parsed_name
 
+    def get_match_keys(self):
+        """Get precomputed name-matching keys (cached)"""
+        if self._match_keys is None:
+            first, last, canonical = self.get_parsed_name()
+            self._match_keys = NameKeys(
+                first, last, canonical,
+                get_canonical_first_name(first) if first else '',
+                soundex(first) if first else '',
+                soundex(last) if last else '')
+        return self._match_keys
+
     def get_normalized_emails(self):
         """Get normalized emails for matching (cached)"""
         if self._normalized_emails is None:
@@ -773,6 +953,12 @@ class VCardContact:
             self._normalized_phones = [normalize_phone(p) for p in self.phones]
         return self._normalized_phones
 
+    def get_org_lc(self):
+        """Get lowercased/stripped org for comparisons (cached)"""
+        if self._org_lc is None:
+            self._org_lc = self.org.lower().strip() if self.org else ''
+        return self._org_lc
+
     def get_display_name(self):
         """Get display name (normalized to remove duplicate words)"""
         if self.fn:
@@ -789,7 +975,10 @@ class VCardContact:
         return " | ".join(parts)
 
     def get_full_details(self):
-        """Get full contact details as text"""
+        """Get full contact details as text (cached until fields change)"""
+        if self._full_details is not None:
+            return self._full_details
+
         details = []
 
         if self.fn:
@@ -828,44 +1017,67 @@ class VCardContact:
                 display_note = note[:200] + '...' if len(note) > 200 else note
                 details.append(f"  - {display_note}")
 
-        return "\n".join(details) if details else "No details available"
+        self._full_details = "\n".join(details) if details else "No details available"
+        return self._full_details
+
+    def to_vcard(self, out=None):
+        """
+        Convert to vCard 3.0 format.
+
+        Args:
+            out: Optional writable text stream. When given, the vCard is
+                written straight to it in one call and None is returned.
+
+        Returns:
+            The vCard text, or None if out was provided.
+        """
+        text = self._vcard_cache
+        if text is not None:
+            if out is not None:
+                out.write(text)
+                return None
+            return text
 
-    def to_vcard(self):
-        """Convert to vCard 3.0 format"""
-        lines = ['BEGIN:VCARD', 'VERSION:3.0']
+        parts = ['BEGIN:VCARD\nVERSION:3.0']
 
         if self.fn:
-            lines.append(f'FN:{self.fn}')
+            parts.append(f'FN:{self.fn}')
 
         if self.n_parts:
-            lines.append(f'N:{";".join(self.n_parts)}')
+            parts.append(f'N:{";".join(self.n_parts)}')
 
-        for email in self.emails:
-            lines.append(f'EMAIL:{email}')
+        if self.emails:
+            parts.append('\n'.join(f'EMAIL:{e}' for e in self.emails))
 
-        for phone in self.phones:
-            lines.append(f'TEL:{phone}')
+        if self.phones:
+            parts.append('\n'.join(f'TEL:{p}' for p in self.phones))
 
-        for addr in self.addresses:
-            lines.append(f'ADR:{addr}')
+        if self.addresses:
+            parts.append('\n'.join(f'ADR:{a}' for a in self.addresses))
 
         if self.org:
-            lines.append(f'ORG:{self.org}')
+            parts.append(f'ORG:{self.org}')
 
         if self.title:
-            lines.append(f'TITLE:{self.title}')
+            parts.append(f'TITLE:{self.title}')
 
         if self.birthday:
-            lines.append(f'BDAY:{self.birthday}')
+            parts.append(f'BDAY:{self.birthday}')
 
         if self.url:
-            lines.append(f'URL:{self.url}')
+            parts.append(f'URL:{self.url}')
+
+        if self.notes:
+            parts.append('\n'.join(f'NOTE:{n}' for n in self.notes))
 
-        for note in self.notes:
-            lines.append(f'NOTE:{note}')
+        parts.append('END:VCARD')
+        text = '\n'.join(parts)
+        self._vcard_cache = text
 
-        lines.append('END:VCARD')
-        return '\n'.join(lines)
+        if out is not None:
+            out.write(text)
+            return None
+        return text
 
     def copy(self):
         """Create a copy of this contact"""
@@ -882,6 +1094,12 @@ class VCardContact:
         new_contact.url = self.url
         new_contact.raw_vcard = self.raw_vcard
         new_contact.source_file = self.source_file
+
+        # Rebuild parse-time membership sets to match the copied lists
+        new_contact._email_lc = {e.lower() for e in new_contact.emails}
+        new_contact._phone_set = set(new_contact.phones)
+        new_contact._addr_set = set(new_contact.addresses)
+        new_contact._note_set = set(new_contact.notes)
         return new_contact
 
 
@@ -926,6 +1144,11 @@ def merge_contacts(contacts):
     # Track sources
     sources = set()
 
+    # Running sets of already-merged values so each email/phone is
+    # normalized once instead of re-normalizing the merged lists per contact
+    merged_email_lc = set()
+    merged_phone_norm = set()
+
     for contact in contacts:
         if contact.source_file:
             sources.add(contact.source_file)
@@ -941,14 +1164,16 @@ def merge_contacts(contacts):
 
         # Merge emails (case-insensitive dedup)
         for email in contact.emails:
-            if email.lower() not in [e.lower() for e in merged.emails]:
+            lc = email.lower()
+            if lc not in merged_email_lc:
+                merged_email_lc.add(lc)
                 merged.emails.append(email)
 
         # Merge phones (normalize for comparison)
-        for phone in contact.phones:
-            norm_phone = normalize_phone(phone)
-            existing_norms = [normalize_phone(p) for p in merged.phones]
-            if norm_phone and norm_phone not in existing_norms:
+        for phone, norm_phone in zip(contact.phones,
+                                     contact.get_normalized_phones()):
+            if norm_phone and norm_phone not in merged_phone_norm:
+                merged_phone_norm.add(norm_phone)
                 merged.phones.append(phone)
 
         # Merge addresses
@@ -992,23 +1217,37 @@ def detect_warnings(contacts):
         return False, []
 
     # Extract data for analysis
-    orgs = [c.org for c in contacts if c.org]
     emails = [e for c in contacts for e in c.emails]
     phones = [p for c in contacts for p in c.phones]
     names = [c.fn for c in contacts if c.fn]
 
     # Warning 1: Conflicting Organizations
-    unique_orgs = set(o.lower().strip() for o in orgs)
+    unique_orgs = set(c.get_org_lc() for c in contacts if c.org)
     org_groups = []
-    for org in unique_orgs:
-        matched = False
-        for group in org_groups:
-            if SequenceMatcher(None, org, group[0]).ratio() > 0.8:
-                group.append(org)
-                matched = True
-                break
-        if not matched:
-            org_groups.append([org])
+    if _rf_process is not None and _np is not None and len(unique_orgs) > 2:
+        # One batched cdist call scores every org against every other;
+        # connected components over the >=80 entries give the clusters
+        orgs_u = list(unique_orgs)
+        matrix = _rf_process.cdist(orgs_u, orgs_u, scorer=_rf_fuzz.ratio,
+                                   score_cutoff=80, dtype=_np.uint8)
+        org_uf = _UnionFind(len(orgs_u))
+        rows, cols = _np.nonzero(_np.triu(matrix, k=1))
+        for r, c in zip(rows.tolist(), cols.tolist()):
+            org_uf.union(r, c)
+        clusters = defaultdict(list)
+        for k, org in enumerate(orgs_u):
+            clusters[org_uf.find(k)].append(org)
+        org_groups = list(clusters.values())
+    else:
+        for org in unique_orgs:
+            matched = False
+            for group in org_groups:
+                if _similarity(org, group[0], 0.8) > 0.8:
+                    group.append(org)
+                    matched = True
+                    break
+            if not matched:
+                org_groups.append([org])
 
     if len(org_groups) > 1:
         warnings.append(f"Different organizations: {', '.join([g[0] for g in org_groups[:3]])}")
@@ -1032,24 +1271,29 @@ def detect_warnings(contacts):
         if len(unique_area_codes) > 2:
             warnings.append(f"Multiple area codes: {len(unique_area_codes)} different locations")
 
-    # Warning 4: No email or phone match
+    # Warning 4: No email or phone match.
+    # Single pass with collision dicts: a normalized value first seen from
+    # one contact and seen again from another means an overlap, with no
+    # pairwise scan over the group
     email_match = False
-    norm_emails_by_contact = [set(c.get_normalized_emails()) for c in contacts]
-    for i, emails1 in enumerate(norm_emails_by_contact):
-        for emails2 in norm_emails_by_contact[i+1:]:
-            if emails1 & emails2:
+    email_owner = {}
+    for i, contact in enumerate(contacts):
+        for email in contact.get_normalized_emails():
+            if email_owner.setdefault(email, i) != i:
                 email_match = True
                 break
+        if email_match:
+            break
 
     phone_match = False
-    for i, c1 in enumerate(contacts):
-        for c2 in contacts[i+1:]:
-            for p1 in c1.get_normalized_phones():
-                for p2 in c2.get_normalized_phones():
-                    if p1 and p2 and len(p1) >= 7 and len(p2) >= 7:
-                        if p1[-7:] == p2[-7:]:
-                            phone_match = True
-                            break
+    last7_owner = {}
+    for i, contact in enumerate(contacts):
+        for phone in contact.get_normalized_phones():
+            if len(phone) >= 7 and last7_owner.setdefault(int(phone[-7:]), i) != i:
+                phone_match = True
+                break
+        if phone_match:
+            break
 
     if not email_match and not phone_match:
         warnings.append("Name-only match: No email or phone number overlap")
@@ -1060,7 +1304,7 @@ def detect_warnings(contacts):
             for name2 in names[i+1:]:
                 _, _, norm1 = parse_name_parts(name1)
                 _, _, norm2 = parse_name_parts(name2)
-                similarity = SequenceMatcher(None, norm1, norm2).ratio()
+                similarity = _similarity(norm1, norm2, 0.6)
                 if similarity < 0.6:
                     warnings.append(f"Names quite different: '{name1}' vs '{name2}'")
                     break
@@ -1072,9 +1316,21 @@ def detect_warnings(contacts):
 # FILE PARSING
 # ============================================================================
 
+# One vCard record: BEGIN through its matching END, any case. Both
+# sentinels are line-anchored so a value that merely contains the
+# substring (e.g. a NOTE with "...END:VCARD...") can't end the record
+_VCARD_RECORD_RE = re.compile(rb'^BEGIN:VCARD.*?^END:VCARD',
+                              re.IGNORECASE | re.DOTALL | re.MULTILINE)
+
+
 def parse_vcard_file(filepath, source_name=None):
     """
-    Parse vCard file using streaming approach for large files.
+    Parse a vCard file by scanning records out of a memory-mapped view.
+
+    The file is mapped read-only and records are located with one compiled
+    regex pass over the raw bytes; only each record's slice is decoded
+    (UTF-8 with replacement), so there is no per-line Python work and no
+    whole-file re-read when a file contains odd bytes.
 
     Args:
         filepath: Path to the vCard file
@@ -1084,47 +1340,33 @@ def parse_vcard_file(filepath, source_name=None):
         List of VCardContact objects
     """
     contacts = []
-    current_vcard = []
-    in_vcard = False
 
     if source_name is None:
         source_name = os.path.basename(filepath)
 
-    # Try UTF-8 first, then fall back to latin-1
-    encodings = ['utf-8', 'latin-1', 'cp1252']
+    with open(filepath, 'rb') as f:
+        try:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped (and hold no records anyway)
+            return contacts
 
-    for encoding in encodings:
         try:
-            with open(filepath, 'r', encoding=encoding, errors='replace') as f:
-                for line in f:
-                    line = line.rstrip('\n\r')
-
-                    if line.upper().startswith('BEGIN:VCARD'):
-                        in_vcard = True
-                        current_vcard = [line]
-                        continue
-
-                    if line.upper().startswith('END:VCARD'):
-                        if in_vcard:
-                            current_vcard.append(line)
-                            vcard_text = '\n'.join(current_vcard)
-
-                            contact = VCardContact()
-                            contact.parse_vcard(vcard_text)
-                            contact.source_file = source_name
-
-                            if contact.fn or contact.emails or contact.phones:
-                                contacts.append(contact)
-
-                            current_vcard = []
-                            in_vcard = False
-                        continue
-
-                    if in_vcard:
-                        current_vcard.append(line)
-            break  # Successfully parsed
-        except UnicodeDecodeError:
-            continue
+            for match in _VCARD_RECORD_RE.finditer(buf):
+                vcard_text = match.group().decode('utf-8', errors='replace')
+                # Normalize line endings the way text mode used to; plain
+                # LF files skip the copy entirely
+                if '\r' in vcard_text:
+                    vcard_text = vcard_text.replace('\r\n', '\n').replace('\r', '\n')
+
+                contact = VCardContact()
+                contact.parse_vcard(vcard_text)
+                contact.source_file = source_name
+
+                if contact.fn or contact.emails or contact.phones:
+                    contacts.append(contact)
+        finally:
+            buf.close()
 
     return contacts
 
@@ -1133,7 +1375,7 @@ def parse_vcard_file(filepath, source_name=None):
 # CONFIDENCE CALCULATION
 # ============================================================================
 
-def calculate_match_confidence(contact1, contact2):
+def calculate_match_confidence(contact1, contact2, name_sim=_similarity):
     """
     Calculate confidence score for a match (0-100) with detailed reasons.
 
@@ -1150,6 +1392,8 @@ def calculate_match_confidence(contact1, contact2):
     Args:
         contact1: First contact to compare
         contact2: Second contact to compare
+        name_sim: Similarity function for canonical names; callers scoring
+            many pairs can pass a batched lookup from _batched_name_similarity
 
     Returns:
         Tuple of (score, list of factor descriptions)
@@ -1182,9 +1426,16 @@ def calculate_match_confidence(contact1, contact2):
         if phone_matched:
             break
 
-    # Name match
-    first1, last1, canonical1 = contact1.get_parsed_name()
-    first2, last2, canonical2 = contact2.get_parsed_name()
+    # Score is capped at 100, so once a block pushes past the cap the
+    # remaining (costlier) comparisons can't change the result
+    if score >= 100:
+        return 100, factors
+
+    # Name match - via precomputed keys, so no parsing or soundex work here
+    keys1 = contact1.get_match_keys()
+    keys2 = contact2.get_match_keys()
+    first1, last1, canonical1 = keys1.first, keys1.last, keys1.canonical
+    first2, last2, canonical2 = keys2.first, keys2.last, keys2.canonical
 
     # Exact canonical match (handles name order)
     if canonical1 and canonical2 and canonical1 == canonical2:
@@ -1192,33 +1443,36 @@ def calculate_match_confidence(contact1, contact2):
         factors.append("Exact name match")
     else:
         # Check for nickname match
-        canonical_first1 = get_canonical_first_name(first1)
-        canonical_first2 = get_canonical_first_name(first2)
+        canonical_first1 = keys1.canonical_first
+        canonical_first2 = keys2.canonical_first
 
         if last1 == last2 and canonical_first1 == canonical_first2:
             score += 45
             factors.append(f"Nickname match ({first1}/{first2} -> {canonical_first1})")
-        elif last1 and last2 and soundex(last1) == soundex(last2):
+        elif last1 and last2 and keys1.soundex_last == keys2.soundex_last:
             if first1 == first2 or canonical_first1 == canonical_first2:
                 score += 35
                 factors.append(f"Phonetic last name match ({last1} ~ {last2})")
         else:
             # Partial name similarity
             if canonical1 and canonical2:
-                sim = SequenceMatcher(None, canonical1, canonical2).ratio()
+                sim = name_sim(canonical1, canonical2, 0.8)
                 if sim > 0.8:
                     partial_score = int(sim * 30)
                     score += partial_score
                     factors.append(f"Name {int(sim*100)}% similar")
 
+    if score >= 100:
+        return 100, factors
+
     # Organization match bonus
-    if contact1.org and contact2.org:
-        org1 = contact1.org.lower().strip()
-        org2 = contact2.org.lower().strip()
+    org1 = contact1.get_org_lc()
+    org2 = contact2.get_org_lc()
+    if org1 and org2:
         if org1 == org2:
             score += 10
             factors.append(f"Same organization: {contact1.org}")
-        elif SequenceMatcher(None, org1, org2).ratio() > 0.8:
+        elif _similarity(org1, org2, 0.8) > 0.8:
             score += 5
             factors.append("Similar organization")
 
@@ -1229,6 +1483,145 @@ def calculate_match_confidence(contact1, contact2):
 # DUPLICATE GROUP FINDING - O(n) Bucketing Algorithm
 # ============================================================================
 
+# Minimum number of candidate pairs before scoring is fanned out to worker
+# processes - below this, pool startup costs more than it saves
+PARALLEL_SCORING_MIN_PAIRS = 2000
+
+# Minimum export size before vCard serialization is fanned out to threads
+PARALLEL_EXPORT_MIN_CONTACTS = 5000
+
+# Worker-side contact list for parallel pair scoring, set once per worker
+# process by the pool initializer so pairs can be shipped as bare indices
+_worker_contacts = None
+
+
+def _init_score_worker(contacts):
+    """Pool initializer: stash the contact list in the worker process"""
+    global _worker_contacts
+    _worker_contacts = contacts
+
+
+def _score_pair_chunk(pairs):
+    """Score a chunk of packed (i << 32 | j) candidate pairs in a worker"""
+    contacts = _worker_contacts
+    results = []
+    for packed in pairs:
+        i = packed >> 32
+        j = packed & 0xFFFFFFFF
+        confidence, factors = calculate_match_confidence(contacts[i], contacts[j])
+        if confidence >= 50:
+            results.append((i, j, confidence, factors))
+    return results
+
+
+class _UnionFind:
+    """Disjoint-set over contact indices with path compression."""
+
+    def __init__(self, n):
+        self.parent = list(range(n))
+
+    def find(self, x):
+        parent = self.parent
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        # Path compression: point everything on the walk at the root
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
+
+    def union(self, a, b):
+        root_a = self.find(a)
+        root_b = self.find(b)
+        if root_a != root_b:
+            self.parent[root_b] = root_a
+
+
+class ContactTable:
+    """
+    Struct-of-arrays view over a contact list for the matching pipeline.
+
+    Columns are plain parallel lists indexed by contact position. Scanning a
+    column walks one compact list instead of chasing attributes across
+    thousands of separate VCardContact objects, and the bucketing loops read
+    precomputed features instead of recomputing them per bucket key. The
+    original contact objects stay available for merge/round-trip work.
+    """
+
+    def __init__(self, contacts):
+        self.contacts = contacts
+        keys = [c.get_match_keys() for c in contacts]
+        self.first = [k.first for k in keys]
+        self.last = [k.last for k in keys]
+        self.canonical = [k.canonical for k in keys]
+        self.canonical_first = [k.canonical_first for k in keys]
+        self.soundex_first = [k.soundex_first for k in keys]
+        self.soundex_last = [k.soundex_last for k in keys]
+        self.norm_emails = [c.get_normalized_emails() for c in contacts]
+        self.norm_phones = [c.get_normalized_phones() for c in contacts]
+
+    def __len__(self):
+        return len(self.contacts)
+
+
+# Above this many unique names the cdist matrix (n^2 bytes) stops being
+# worth its memory; fall back to per-pair scoring
+_NAME_SIM_MATRIX_MAX_NAMES = 4000
+
+
+def _batched_name_similarity(pairs, table):
+    """
+    Build a canonical-name similarity lookup for a batch of candidate pairs.
+
+    With rapidfuzz + numpy, the unique canonical names referenced by the
+    pairs are scored in one parallel cdist call and the returned function is
+    a matrix lookup. Otherwise (or for oversized batches) the scalar
+    _similarity helper is returned unchanged.
+    """
+    if _rf_process is None or _np is None or not pairs:
+        return _similarity
+
+    unique = list({table.canonical[i]
+                   for packed in pairs
+                   for i in (packed >> 32, packed & 0xFFFFFFFF)})
+    if len(unique) > _NAME_SIM_MATRIX_MAX_NAMES:
+        return _similarity
+
+    name_idx = {n: k for k, n in enumerate(unique)}
+    matrix = _rf_process.cdist(unique, unique, scorer=_rf_fuzz.ratio,
+                               workers=-1, dtype=_np.uint8)
+
+    def name_sim(a, b, threshold=0.0):
+        # threshold prefiltering is unnecessary here - scores are already
+        # materialized - but the signature matches _similarity
+        return matrix[name_idx[a], name_idx[b]] / 100.0
+
+    return name_sim
+
+
+def _similar_name_pairs(indices, canonicals, score_cutoff=75):
+    """
+    Yield (i, j) contact-index pairs from one bucket whose canonical names
+    are similar enough to be worth scoring.
+
+    With rapidfuzz installed, the whole bucket is scored in a single batched
+    cdist call (C code, parallel across cores) instead of k^2 Python-level
+    comparisons. Without it, every pair is yielded so behavior matches the
+    original all-pairs enumeration.
+    """
+    if _rf_process is not None and _np is not None and len(indices) > 2:
+        matrix = _rf_process.cdist(canonicals, canonicals,
+                                   scorer=_rf_fuzz.token_sort_ratio,
+                                   score_cutoff=score_cutoff, workers=-1)
+        rows, cols = _np.nonzero(_np.triu(matrix, k=1))
+        for r, c in zip(rows.tolist(), cols.tolist()):
+            yield indices[r], indices[c]
+    else:
+        for a in range(len(indices)):
+            for b in range(a + 1, len(indices)):
+                yield indices[a], indices[b]
+
+
 def find_similar_groups(contacts, threshold=0.75, progress_callback=None):
     """
     Group contacts by similarity with confidence scores.
@@ -1238,6 +1631,7 @@ def find_similar_groups(contacts, threshold=0.75, progress_callback=None):
     - Email buckets: exact normalized email -> contact indices
     - Phone buckets: last 10 digits -> contact indices
     - Canonical name buckets: "firstname lastname" -> contact indices
+    - Blocking buckets: (soundex(last), canonical first initial) -> indices
     - Soundex buckets: soundex(first) + soundex(last) -> contact indices
     - Nickname-expanded buckets: canonical name with nicknames resolved
 
@@ -1254,102 +1648,163 @@ def find_similar_groups(contacts, threshold=0.75, progress_callback=None):
     if progress_callback:
         progress_callback(0, 100, "Building search indices...")
 
+    # Phase 0: Batch-precompute the per-contact features into parallel
+    # columns. One pass up front amortizes parsing/soundex cost and the
+    # bucket loop below then only does list indexing.
+    table = ContactTable(contacts)
+
     # Phase 1: Create buckets for efficient matching
     email_buckets = defaultdict(list)
-    phone_buckets = defaultdict(list)
+    phone_entries = []
     name_buckets = defaultdict(list)
     soundex_buckets = defaultdict(list)
+    block_buckets = defaultdict(list)
     canonical_name_buckets = defaultdict(list)
     nickname_buckets = defaultdict(list)
 
-    for i, contact in enumerate(contacts):
+    for i in range(len(table)):
         # Email buckets (normalized)
-        for email in contact.get_normalized_emails():
+        for email in table.norm_emails[i]:
             if email:
                 email_buckets[email].append(i)
 
-        # Phone buckets (last 7-10 digits)
-        for phone in contact.get_normalized_phones():
+        # Phone buckets (last 7-10 digits). Keys are ints: integer hashing
+        # is a single op vs. walking the digit string, and any key collision
+        # between the 7- and 10-digit spaces implies a shared last-7 anyway
+        for phone in table.norm_phones[i]:
             if len(phone) >= 7:
-                phone_buckets[phone[-7:]].append(i)
+                phone_entries.append((int(phone[-7:]), i))
             if len(phone) >= 10:
-                phone_buckets[phone[-10:]].append(i)
+                phone_entries.append((int(phone[-10:]), i))
 
-        # Name-based buckets
-        first, last, norm_name = contact.get_parsed_name()
+        # Name-based buckets (feature columns precomputed above). Keys are
+        # tuples of the already-interned feature strings: tuple hashing
+        # combines their cached hashes instead of building a joined string
+        # per contact.
+        first = table.first[i]
+        last = table.last[i]
+        sx_last = table.soundex_last[i]
+        canonical_first = table.canonical_first[i]
 
         if last:
-            # Last name bucket
-            name_buckets[last.lower()].append(i)
+            # Last name bucket (parse_name_parts already lowercased it)
+            name_buckets[last].append(i)
 
-            # Soundex bucket for last name
-            sx = soundex(last)
-            if sx:
-                soundex_buckets[sx].append(i)
+            # Blocking bucket: phonetic last name + canonical first initial.
+            # Much more selective than last-name soundex alone, so common
+            # surnames don't explode into huge candidate sets.
+            if sx_last:
+                block_buckets[(sx_last, canonical_first[:1])].append(i)
 
         if first and last:
             # Canonical first + last name bucket
-            canonical_key = f"{first}_{last}"
-            canonical_name_buckets[canonical_key].append(i)
+            canonical_name_buckets[(first, last)].append(i)
 
             # Nickname-expanded bucket
-            canonical_first = get_canonical_first_name(first)
-            nickname_key = f"{canonical_first}_{last}"
-            nickname_buckets[nickname_key].append(i)
+            nickname_buckets[(canonical_first, last)].append(i)
 
             # Combined soundex bucket
-            first_sx = soundex(first)
-            last_sx = soundex(last)
-            if first_sx and last_sx:
-                soundex_buckets[f"{first_sx}_{last_sx}"].append(i)
+            sx_first = table.soundex_first[i]
+            if sx_first and sx_last:
+                soundex_buckets[(sx_first, sx_last)].append(i)
 
     if progress_callback:
         progress_callback(20, 100, "Finding candidate pairs...")
 
-    # Phase 2: Build candidate pairs from buckets
+    # Phase 2: Build candidate pairs from buckets.
+    #
+    # Buckets whose shared key alone clears the 50-point keep threshold
+    # (shared email, exact canonical name: +50 each) are transitive in the
+    # match graph too: every chained pair becomes a real edge, so a chain
+    # of k-1 pairs connects a k-entry bucket just as well as its k^2
+    # all-pairs enumeration. A union-find tracks that guaranteed
+    # connectivity so later buckets skip pairs it already covers. Phone
+    # (+40) and nickname (+45) keys score below the threshold - a chained
+    # pair through a non-matching intermediary would connect the union-find
+    # without producing an edge and suppress real matches - so those
+    # buckets keep all-pairs enumeration and never feed the union-find.
+    #
+    # Pairs are stored packed as (lo << 32) | hi: one small int per pair in
+    # the dedup set instead of a tuple plus two boxed ints, and sorting the
+    # packed keys is the same order as sorting the tuples.
     candidate_pairs = set()
+    uf = _UnionFind(len(table))
+
+    def _chain_bucket(indices):
+        prev = indices[0]
+        for cur in indices[1:]:
+            if uf.find(prev) != uf.find(cur):
+                uf.union(prev, cur)
+                if prev < cur:
+                    candidate_pairs.add((prev << 32) | cur)
+                else:
+                    candidate_pairs.add((cur << 32) | prev)
+            prev = cur
+
+    def _all_pairs_bucket(indices):
+        for a in range(len(indices)):
+            i = indices[a]
+            for b in range(a + 1, len(indices)):
+                j = indices[b]
+                if i < j:
+                    candidate_pairs.add((i << 32) | j)
+                else:
+                    candidate_pairs.add((j << 32) | i)
 
-    # Add pairs from email buckets (very high confidence)
+    # Guaranteed-edge buckets (chained; no size cutoff needed at O(k) cost)
     for indices in email_buckets.values():
         if len(indices) > 1:
-            for i in range(len(indices)):
-                for j in range(i+1, len(indices)):
-                    candidate_pairs.add((min(indices[i], indices[j]), max(indices[i], indices[j])))
-
-    # Add pairs from phone buckets (high confidence)
-    for indices in phone_buckets.values():
-        if len(indices) > 1:
-            for i in range(len(indices)):
-                for j in range(i+1, len(indices)):
-                    candidate_pairs.add((min(indices[i], indices[j]), max(indices[i], indices[j])))
+            _chain_bucket(indices)
 
-    # Add pairs from canonical name buckets
     for indices in canonical_name_buckets.values():
-        if 1 < len(indices) <= 100:
-            for i in range(len(indices)):
-                for j in range(i+1, len(indices)):
-                    candidate_pairs.add((min(indices[i], indices[j]), max(indices[i], indices[j])))
+        if len(indices) > 1:
+            _chain_bucket(indices)
+
+    # Phone buckets come from one sort over (key, idx) tuples plus groupby
+    # runs instead of growing a dict with one list per key: the sort is a
+    # single C call and equal keys land contiguously
+    phone_entries.sort()
+    for _, run in groupby(phone_entries, key=itemgetter(0)):
+        indices = [idx for _, idx in run]
+        if len(indices) > 1:
+            _all_pairs_bucket(indices)
 
-    # Add pairs from nickname buckets
     for indices in nickname_buckets.values():
         if 1 < len(indices) <= 100:
-            for i in range(len(indices)):
-                for j in range(i+1, len(indices)):
-                    candidate_pairs.add((min(indices[i], indices[j]), max(indices[i], indices[j])))
+            _all_pairs_bucket(indices)
 
-    # Add pairs from soundex buckets (phonetic matching)
+    # Add pairs from blocking buckets (phonetic last name + first initial)
+    for indices in block_buckets.values():
+        if 1 < len(indices) <= 100:
+            canonicals = [table.canonical[k] for k in indices]
+            for i, j in _similar_name_pairs(indices, canonicals):
+                if uf.find(i) != uf.find(j):
+                    if i < j:
+                        candidate_pairs.add((i << 32) | j)
+                    else:
+                        candidate_pairs.add((j << 32) | i)
+
+    # Add pairs from combined soundex buckets (phonetic matching)
     for indices in soundex_buckets.values():
         if 1 < len(indices) <= 50:
-            for i in range(len(indices)):
-                for j in range(i+1, len(indices)):
-                    candidate_pairs.add((min(indices[i], indices[j]), max(indices[i], indices[j])))
+            canonicals = [table.canonical[k] for k in indices]
+            for i, j in _similar_name_pairs(indices, canonicals):
+                if uf.find(i) != uf.find(j):
+                    if i < j:
+                        candidate_pairs.add((i << 32) | j)
+                    else:
+                        candidate_pairs.add((j << 32) | i)
 
     # Add pairs from exact last name buckets
     for indices in name_buckets.values():
         if 1 < len(indices) <= 100:
-            for i in range(len(indices)):
-                for j in range(i+1, len(indices)):
-                    candidate_pairs.add((min(indices[i], indices[j]), max(indices[i], indices[j])))
+            canonicals = [table.canonical[k] for k in indices]
+            for i, j in _similar_name_pairs(indices, canonicals):
+                if uf.find(i) != uf.find(j):
+                    if i < j:
+                        candidate_pairs.add((i << 32) | j)
+                    else:
+                        candidate_pairs.add((j << 32) | i)
 
     if progress_callback:
         progress_callback(40, 100, f"Evaluating {len(candidate_pairs):,} candidate pairs...")
@@ -1357,62 +1812,94 @@ def find_similar_groups(contacts, threshold=0.75, progress_callback=None):
     # Phase 3: Evaluate candidate pairs
     match_graph = defaultdict(list)
 
-    pairs_processed = 0
     total_pairs = len(candidate_pairs)
 
-    for i, j in candidate_pairs:
-        contact1 = contacts[i]
-        contact2 = contacts[j]
+    if total_pairs >= PARALLEL_SCORING_MIN_PAIRS:
+        # Scoring is CPU-bound pure Python, so fan it out across worker
+        # processes. Contacts ship once per worker via the pool initializer;
+        # the pairs themselves travel as bare index tuples.
+        import multiprocessing
+
+        pair_list = sorted(candidate_pairs)
+        n_workers = max(multiprocessing.cpu_count() - 1, 1)
+        chunk_size = max(len(pair_list) // (n_workers * 8), 500)
+        chunks = [pair_list[k:k + chunk_size]
+                  for k in range(0, len(pair_list), chunk_size)]
+
+        pairs_processed = 0
+        with multiprocessing.Pool(n_workers, initializer=_init_score_worker,
+                                  initargs=(contacts,)) as pool:
+            for results in pool.imap_unordered(_score_pair_chunk, chunks):
+                for i, j, confidence, factors in results:
+                    match_graph[i].append((j, confidence, factors))
+                    match_graph[j].append((i, confidence, factors))
+
+                pairs_processed = min(pairs_processed + chunk_size, total_pairs)
+                if progress_callback:
+                    pct = 40 + int(40 * pairs_processed / total_pairs)
+                    progress_callback(pct, 100, f"Evaluated {pairs_processed:,} of {total_pairs:,} pairs...")
+    else:
+        pairs_processed = 0
+        name_sim = _batched_name_similarity(candidate_pairs, table)
 
-        confidence, factors = calculate_match_confidence(contact1, contact2)
+        for packed in candidate_pairs:
+            i = packed >> 32
+            j = packed & 0xFFFFFFFF
+            contact1 = contacts[i]
+            contact2 = contacts[j]
 
-        # Keep if confidence is high enough
-        if confidence >= 50:
-            match_graph[i].append((j, confidence, factors))
-            match_graph[j].append((i, confidence, factors))
+            confidence, factors = calculate_match_confidence(contact1, contact2, name_sim)
+
+            # Keep if confidence is high enough
+            if confidence >= 50:
+                match_graph[i].append((j, confidence, factors))
+                match_graph[j].append((i, confidence, factors))
 
-        pairs_processed += 1
-        if progress_callback and pairs_processed % 1000 == 0:
-            pct = 40 + int(40 * pairs_processed / total_pairs)
-            progress_callback(pct, 100, f"Evaluated {pairs_processed:,} of {total_pairs:,} pairs...")
+            pairs_processed += 1
+            if progress_callback and pairs_processed % 1000 == 0:
+                pct = 40 + int(40 * pairs_processed / total_pairs)
+                progress_callback(pct, 100, f"Evaluated {pairs_processed:,} of {total_pairs:,} pairs...")
 
     if progress_callback:
         progress_callback(80, 100, "Building duplicate groups...")
 
     # Phase 4: Extract connected components as groups
     groups = []
-    processed = set()
+    processed = bytearray(len(contacts))
 
     for start_idx in range(len(contacts)):
-        if start_idx in processed or start_idx not in match_graph:
+        if processed[start_idx] or start_idx not in match_graph:
             continue
 
-        # BFS to find all connected contacts
+        # BFS to find all connected contacts (deque: popleft is O(1),
+        # list.pop(0) would make large components quadratic)
         group_indices = []
-        all_confidences = []
-        all_factors = []
-        queue_bfs = [start_idx]
+        conf_sum = 0
+        conf_n = 0
+        factor_set = set()
+        queue_bfs = deque([start_idx])
         visited = {start_idx}
 
         while queue_bfs:
-            current = queue_bfs.pop(0)
+            current = queue_bfs.popleft()
             group_indices.append(current)
-            processed.add(current)
+            processed[current] = 1
 
             for neighbor, conf, factors in match_graph.get(current, []):
                 if neighbor not in visited:
                     visited.add(neighbor)
                     queue_bfs.append(neighbor)
-                    all_confidences.append(conf)
-                    all_factors.extend(factors)
+                    conf_sum += conf
+                    conf_n += 1
+                    factor_set.update(factors)
 
         if len(group_indices) > 1:
-            avg_confidence = sum(all_confidences) / len(all_confidences) if all_confidences else 50
+            avg_confidence = conf_sum / conf_n if conf_n else 50
 
             groups.append({
                 'indices': group_indices,
                 'confidence': int(avg_confidence),
-                'match_factors': list(set(all_factors))
+                'match_factors': list(factor_set)
             })
 
     # Sort by confidence (high to low)
@@ -1428,6 +1915,18 @@ def find_similar_groups(contacts, threshold=0.75, progress_callback=None):
 # UI COMPONENTS
 # ============================================================================
 
+# Shared worker for dialog precomputation (merge preview, warning checks)
+# so opening a preview never blocks the Tk mainloop
+_preview_executor = None
+
+
+def _get_preview_executor():
+    global _preview_executor
+    if _preview_executor is None:
+        _preview_executor = ThreadPoolExecutor(max_workers=1)
+    return _preview_executor
+
+
 class PreviewMergeDialog:
     """Dialog for previewing merged contact result"""
 
@@ -1448,21 +1947,46 @@ class PreviewMergeDialog:
         self.group_idx = group_idx
         self.app_ref = app_ref
         self.match_factors = match_factors or []
-        self.merged_contact = merge_contacts(contacts)
+
+        # Kick the merge and warning computation to the worker thread; the
+        # shell UI opens immediately and _poll_futures fills it in. A group
+        # the user already edited skips the merge entirely.
+        cached = None
+        if app_ref is not None:
+            cached = (app_ref.edited_merges.get(group_idx)
+                      or app_ref.merged_cache.get(group_idx))
+        if cached is not None:
+            self.merged_contact = cached
+            self._merge_future = None
+        else:
+            self.merged_contact = None
+            self._merge_future = _get_preview_executor().submit(
+                merge_contacts, contacts)
+        self._warnings_future = _get_preview_executor().submit(
+            detect_warnings, contacts)
+        self._last_rendered_details = None
 
         self.dialog = tk.Toplevel(parent)
         self.dialog.title(f"Preview Merge - Group {group_idx + 1}")
-        self.dialog.geometry("1000x750")
         self.dialog.transient(parent)
-        self.dialog.grab_set()
 
+        # Build the widget tree while the window is withdrawn so Tk
+        # coalesces everything into one layout/redraw at deiconify instead
+        # of relaying out after each pack/grid
+        self.dialog.withdraw()
         self.setup_ui()
 
-        # Center dialog
-        self.dialog.update_idletasks()
-        x = (self.dialog.winfo_screenwidth() // 2) - (self.dialog.winfo_width() // 2)
-        y = (self.dialog.winfo_screenheight() // 2) - (self.dialog.winfo_height() // 2)
-        self.dialog.geometry(f'+{x}+{y}')
+        # Size and center in one geometry request: the dialog size is fixed,
+        # so there is no need to realise the window just to measure it
+        w, h = 1000, 750
+        x = (self.dialog.winfo_screenwidth() - w) // 2
+        y = (self.dialog.winfo_screenheight() - h) // 2
+        self.dialog.geometry(f'{w}x{h}+{x}+{y}')
+        self.dialog.deiconify()
+        self.dialog.grab_set()
+
+        if self._merge_future is not None or self._warnings_future is not None:
+            self.dialog.after(30, self._poll_futures)
 
     def setup_ui(self):
         """Setup the dialog UI"""
@@ -1476,21 +2000,22 @@ class PreviewMergeDialog:
         tk.Label(header_frame, text="Preview Merge Result",
                 font=('Arial', 14, 'bold'), bg='#2196F3', fg='white').pack(pady=10)
 
-        # Match explanation section
+        # Match explanation section - one tagged Text instead of a Label
+        # per factor (each Label is a full Tk widget with its own options)
         if self.match_factors:
-            match_frame = tk.Frame(main_frame, bg='#4CAF50', relief='solid', borderwidth=1)
-            match_frame.pack(fill='x', pady=(0, 10))
-
-            tk.Label(match_frame, text="Why these contacts matched:",
-                    font=('Arial', 10, 'bold'), bg='#4CAF50', fg='white').pack(anchor='w', padx=10, pady=5)
-
-            for factor in self.match_factors[:5]:
-                tk.Label(match_frame, text=f"  {factor}",
-                        font=('Arial', 9), bg='#4CAF50', fg='white').pack(anchor='w', padx=15)
-
+            lines = ["Why these contacts matched:"]
+            lines.extend(f"  {factor}" for factor in self.match_factors[:5])
             if len(self.match_factors) > 5:
-                tk.Label(match_frame, text=f"  ... and {len(self.match_factors) - 5} more factors",
-                        font=('Arial', 9, 'italic'), bg='#4CAF50', fg='#E8F5E9').pack(anchor='w', padx=15, pady=(0, 5))
+                lines.append(f"  ... and {len(self.match_factors) - 5} more factors")
+
+            match_text = tk.Text(main_frame, height=len(lines), bg='#4CAF50',
+                                 fg='white', relief='solid', borderwidth=1,
+                                 font=('Arial', 9), wrap='none', cursor='arrow')
+            match_text.tag_configure('title', font=('Arial', 10, 'bold'))
+            match_text.insert('1.0', '\n'.join(lines))
+            match_text.tag_add('title', '1.0', '1.end')
+            match_text.config(state='disabled')
+            match_text.pack(fill='x', pady=(0, 10))
 
         # Content: Side by side view
         content_frame = tk.Frame(main_frame)
@@ -1501,62 +2026,56 @@ class PreviewMergeDialog:
                                    font=('Arial', 11, 'bold'))
         left_frame.pack(side='left', fill='both', expand=True, padx=(0, 5))
 
-        left_canvas = tk.Canvas(left_frame)
-        left_scroll = tk.Scrollbar(left_frame, orient='vertical', command=left_canvas.yview)
-        left_scrollable = tk.Frame(left_canvas)
-
-        left_scrollable.bind(
-            "<Configure>",
-            lambda e: left_canvas.configure(scrollregion=left_canvas.bbox("all"))
-        )
-
-        left_canvas.create_window((0, 0), window=left_scrollable, anchor='nw')
-        left_canvas.configure(yscrollcommand=left_scroll.set)
-
+        # One shared read-only Text for all originals: every Text widget
+        # carries its own Tcl state, tag table and layout pass, so N blocks
+        # in a single widget render far faster than N widgets - and the
+        # whole content goes in with one insert call. Duplicate pairs are
+        # by far the common case and fit without scrolling, so they skip
+        # the scrollbar machinery too.
+        if len(self.contacts) <= 2:
+            left_text = tk.Text(left_frame, width=40,
+                                font=('Courier', 9), wrap='word')
+        else:
+            left_text = scrolledtext.ScrolledText(left_frame, width=40,
+                                                  font=('Courier', 9), wrap='word')
+        left_text.pack(fill='both', expand=True, padx=5, pady=5)
+        left_text.tag_configure('header', font=('Arial', 10, 'bold'),
+                                background='#2196F3', foreground='white')
+
+        blocks = []
+        header_lines = []
+        line = 1
         for i, contact in enumerate(self.contacts):
-            contact_frame = tk.Frame(left_scrollable, relief='solid', borderwidth=1, bg='white')
-            contact_frame.pack(fill='x', padx=5, pady=5)
-
             source_text = f" (from {contact.source_file})" if contact.source_file else ""
-            tk.Label(contact_frame, text=f"Contact {i+1}{source_text}",
-                    font=('Arial', 10, 'bold'), bg='#2196F3', fg='white').pack(fill='x', padx=5, pady=3)
-
-            details_text = scrolledtext.ScrolledText(contact_frame, height=10, width=35,
-                                                     font=('Courier', 9), wrap='word')
-            details_text.pack(fill='both', padx=5, pady=5)
-            details_text.insert('1.0', contact.get_full_details())
-            details_text.config(state='disabled')
+            details = contact.get_full_details()
+            blocks.append(f"Contact {i+1}{source_text}\n{details}\n")
+            header_lines.append(line)
+            # header + detail lines + separator blank from the join
+            line += details.count('\n') + 3
 
-        left_canvas.pack(side='left', fill='both', expand=True)
-        left_scroll.pack(side='right', fill='y')
+        left_text.insert('1.0', '\n'.join(blocks))
+        for ln in header_lines:
+            left_text.tag_add('header', f'{ln}.0', f'{ln}.end')
+        left_text.config(state='disabled')
 
         # Right: Merged result
         right_frame = tk.LabelFrame(content_frame, text="Merged Result Preview",
                                     font=('Arial', 11, 'bold'))
         right_frame.pack(side='right', fill='both', expand=True, padx=(5, 0))
 
-        # Check for warnings
-        has_warnings, warning_list = detect_warnings(self.contacts)
-
-        if has_warnings:
-            warning_frame = tk.Frame(right_frame, bg='#FF9800', relief='solid', borderwidth=2)
-            warning_frame.pack(fill='x', padx=10, pady=10)
-
-            tk.Label(warning_frame, text="Warnings Detected",
-                    font=('Arial', 10, 'bold'), bg='#FF9800', fg='white').pack(pady=5)
-
-            for warning in warning_list:
-                tk.Label(warning_frame, text=warning,
-                        font=('Arial', 9), bg='#FF9800', fg='white', anchor='w').pack(padx=10, anchor='w')
-
-            tk.Label(warning_frame, text="Review carefully before merging",
-                    font=('Arial', 9, 'italic'), bg='#FF9800', fg='white').pack(pady=5)
+        # Warnings arrive from the worker thread; this container is filled
+        # by _poll_futures once detect_warnings finishes
+        self._warning_container = tk.Frame(right_frame)
+        self._warning_container.pack(fill='x')
 
         # Merged text widget
         self.merged_text = scrolledtext.ScrolledText(right_frame, font=('Courier', 10),
                                                wrap='word', bg='white', fg='black')
         self.merged_text.pack(fill='both', expand=True, padx=10, pady=10)
-        self.update_merged_display()
+        # Fill on first map: a dialog dismissed before the widget is ever
+        # shown skips the details formatting entirely
+        self._merged_filled = False
+        self.merged_text.bind('<Map>', self._lazy_fill_merged)
 
         # Buttons
         btn_frame = tk.Frame(self.dialog, bg='#f0f0f0', relief='solid', borderwidth=1)
@@ -1572,21 +2091,91 @@ class PreviewMergeDialog:
                                         bg_color='#757575', font=('Arial', 12), width=15)
         close_btn.pack(side='right', padx=10, pady=10)
 
+    def _poll_futures(self):
+        """Fill in worker-thread results (merged preview, warnings)"""
+        if not self.dialog.winfo_exists():
+            return
+
+        pending = False
+
+        if self._merge_future is not None:
+            if self._merge_future.done():
+                self.merged_contact = self._merge_future.result()
+                self._merge_future = None
+                if self.app_ref is not None:
+                    self.app_ref.merged_cache[self.group_idx] = self.merged_contact
+                self.update_merged_display()
+            else:
+                pending = True
+
+        if self._warnings_future is not None:
+            if self._warnings_future.done():
+                has_warnings, warning_list = self._warnings_future.result()
+                self._warnings_future = None
+                if has_warnings:
+                    self._show_warnings(warning_list)
+            else:
+                pending = True
+
+        if pending:
+            self.dialog.after(30, self._poll_futures)
+
+    def _show_warnings(self, warning_list):
+        """Populate the warning banner above the merged preview"""
+        lines = (["Warnings Detected"] + warning_list
+                 + ["Review carefully before merging"])
+
+        warning_text = tk.Text(self._warning_container, height=len(lines),
+                               bg='#FF9800', fg='white', relief='solid',
+                               borderwidth=2, font=('Arial', 9), wrap='none',
+                               cursor='arrow')
+        warning_text.tag_configure('title', font=('Arial', 10, 'bold'),
+                                   justify='center')
+        warning_text.tag_configure('footer', font=('Arial', 9, 'italic'),
+                                   justify='center')
+        warning_text.insert('1.0', '\n'.join(lines))
+        warning_text.tag_add('title', '1.0', '1.end')
+        warning_text.tag_add('footer', f'{len(lines)}.0', f'{len(lines)}.end')
+        warning_text.config(state='disabled')
+        warning_text.pack(fill='x', padx=10, pady=10)
+
+    def _lazy_fill_merged(self, event=None):
+        """First-map hook: render the merged preview exactly once"""
+        if not self._merged_filled:
+            self._merged_filled = True
+            self.update_merged_display()
+
     def update_merged_display(self):
         """Update the merged contact display"""
+        if self.merged_contact is not None:
+            details = self.merged_contact.get_full_details()
+        else:
+            details = "Computing merged preview..."
+
+        # Unchanged content (e.g. a cancelled edit round-trip) skips the
+        # delete/insert so Tk doesn't re-layout identical text
+        if details == self._last_rendered_details:
+            return
+        self._last_rendered_details = details
+
         self.merged_text.config(state='normal')
         self.merged_text.delete('1.0', 'end')
-        self.merged_text.insert('1.0', self.merged_contact.get_full_details())
+        self.merged_text.insert('1.0', details)
         self.merged_text.config(state='disabled')
 
     def edit_merged(self):
         """Open dialog to edit the merged contact"""
+        if self.merged_contact is None:
+            # Merge still computing in the worker; nothing to edit yet
+            return
         edit_dialog = EditContactDialog(self.dialog, self.merged_contact)
         self.dialog.wait_window(edit_dialog.dialog)
 
         if edit_dialog.result:
             self.merged_contact = edit_dialog.result
             self.app_ref.edited_merges[self.group_idx] = self.merged_contact
+            # Edited version supersedes any cached automatic merge
+            self.app_ref.merged_cache.pop(self.group_idx, None)
             self.update_merged_display()
             messagebox.showinfo("Saved",
                               "Your edits have been saved!\n\n"
@@ -1594,6 +2183,17 @@ class PreviewMergeDialog:
                               parent=self.dialog)
 
 
+# Note separator as rendered by the edit dialog ('\n---\n' between notes);
+# consuming the surrounding newlines in the split keeps them out of the
+# per-part strips
+_NOTE_SPLIT_RE = re.compile(r'\n?---\n?')
+
+
+def _truncate_addr(addr, _limit=60):
+    """Clip an address to one listbox-friendly line"""
+    return addr if len(addr) <= _limit else addr[:_limit] + '...'
+
+
 class EditContactDialog:
     """Dialog for editing merged contact"""
 
@@ -1607,54 +2207,87 @@ class EditContactDialog:
         """
         _import_tkinter()  # Ensure tkinter is loaded
         self.result = None
-        self.contact = contact.copy()
+        # Copy-on-write: most previews are opened and closed without any
+        # edit, so the defensive copy is deferred to the first mutation
+        self.contact = contact
+        self._copied = False
+        # Listbox row -> index into contact.addresses, kept in step as rows
+        # are deleted; removals are applied in one pass at save time
+        self._addr_indices = list(range(len(contact.addresses)))
+        self._removed_addrs = set()
 
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("Edit Merged Contact")
-        self.dialog.geometry("600x750")
         self.dialog.transient(parent)
-        self.dialog.grab_set()
 
+        # Widget tree is built lazily on first map rather than here, so the
+        # (fixed-size) window can be positioned and shown without paying for
+        # the full form construction up front
+        self._built = False
+        self.dialog.withdraw()
+        self.dialog.bind('<Map>', lambda e: self._build_once())
+
+        # Size and center with a single geometry request (see
+        # PreviewMergeDialog for the same pattern)
+        w, h = 600, 750
+        x = (self.dialog.winfo_screenwidth() - w) // 2
+        y = (self.dialog.winfo_screenheight() - h) // 2
+        self.dialog.geometry(f'{w}x{h}+{x}+{y}')
+        self.dialog.deiconify()
+
+    def _build_once(self):
+        """Build the widget tree on first map; no-op on later map events"""
+        if self._built:
+            return
+        self._built = True
         self.setup_ui()
-
-        self.dialog.update_idletasks()
-        x = (self.dialog.winfo_screenwidth() // 2) - (self.dialog.winfo_width() // 2)
-        y = (self.dialog.winfo_screenheight() // 2) - (self.dialog.winfo_height() // 2)
-        self.dialog.geometry(f'+{x}+{y}')
+        self.dialog.grab_set()
 
     def setup_ui(self):
         """Setup the dialog UI"""
         main_frame = tk.Frame(self.dialog)
         main_frame.pack(fill='both', expand=True, padx=20, pady=20)
 
+        # Two-phase layout: build every row's widgets first, then hand the
+        # whole set to the geometry manager in one pass at the end, so the
+        # grid solver runs once instead of re-solving after each row
+        rows = []
+
         # Name
-        tk.Label(main_frame, text="Name:", font=('Arial', 11, 'bold')).grid(row=0, column=0, sticky='w', pady=5)
+        name_label = tk.Label(main_frame, text="Name:", font=('Arial', 11, 'bold'))
         self.name_entry = tk.Entry(main_frame, font=('Arial', 11), width=50)
         self.name_entry.insert(0, self.contact.fn)
-        self.name_entry.grid(row=0, column=1, pady=5, sticky='ew')
+        rows.append((name_label, self.name_entry, 'w'))
 
         # Organization
-        tk.Label(main_frame, text="Organization:", font=('Arial', 11, 'bold')).grid(row=1, column=0, sticky='w', pady=5)
+        org_label = tk.Label(main_frame, text="Organization:", font=('Arial', 11, 'bold'))
         self.org_entry = tk.Entry(main_frame, font=('Arial', 11), width=50)
         self.org_entry.insert(0, self.contact.org)
-        self.org_entry.grid(row=1, column=1, pady=5, sticky='ew')
+        rows.append((org_label, self.org_entry, 'w'))
 
         # Title
-        tk.Label(main_frame, text="Title:", font=('Arial', 11, 'bold')).grid(row=2, column=0, sticky='w', pady=5)
+        title_label = tk.Label(main_frame, text="Title:", font=('Arial', 11, 'bold'))
         self.title_entry = tk.Entry(main_frame, font=('Arial', 11), width=50)
         self.title_entry.insert(0, self.contact.title)
-        self.title_entry.grid(row=2, column=1, pady=5, sticky='ew')
+        rows.append((title_label, self.title_entry, 'w'))
 
         # Emails
-        tk.Label(main_frame, text="Emails:", font=('Arial', 11, 'bold')).grid(row=3, column=0, sticky='nw', pady=5)
-
+        email_label = tk.Label(main_frame, text="Emails:", font=('Arial', 11, 'bold'))
         email_frame = tk.Frame(main_frame)
-        email_frame.grid(row=3, column=1, pady=5, sticky='ew')
-
-        self.email_listbox = tk.Listbox(email_frame, height=4, font=('Arial', 10))
-        for email in self.contact.emails:
-            self.email_listbox.insert('end', email)
-        self.email_listbox.pack(side='left', fill='both', expand=True)
+        rows.append((email_label, email_frame, 'nw'))
+
+        # Listbox with an inline entry beneath it; adding goes through the
+        # entry rather than a modal askstring dialog per item
+        email_list_frame = tk.Frame(email_frame)
+        email_list_frame.pack(side='left', fill='both', expand=True)
+        self.email_listbox = tk.Listbox(email_list_frame, height=4, font=('Arial', 10))
+        # Varargs insert forwards the whole list as one Tcl command instead
+        # of one interpreter round-trip per row
+        self.email_listbox.insert('end', *self.contact.emails)
+        self.email_listbox.pack(fill='both', expand=True)
+        self.email_entry = tk.Entry(email_list_frame, font=('Arial', 10))
+        self.email_entry.pack(fill='x', pady=(2, 0))
+        self.email_entry.bind('<Return>', lambda e: self.add_email())
 
         email_btn_frame = tk.Frame(email_frame)
         email_btn_frame.pack(side='right', padx=5)
@@ -1666,15 +2299,18 @@ class EditContactDialog:
         rem_email_btn.pack(pady=2)
 
         # Phones
-        tk.Label(main_frame, text="Phones:", font=('Arial', 11, 'bold')).grid(row=4, column=0, sticky='nw', pady=5)
-
+        phone_label = tk.Label(main_frame, text="Phones:", font=('Arial', 11, 'bold'))
         phone_frame = tk.Frame(main_frame)
-        phone_frame.grid(row=4, column=1, pady=5, sticky='ew')
+        rows.append((phone_label, phone_frame, 'nw'))
 
-        self.phone_listbox = tk.Listbox(phone_frame, height=4, font=('Arial', 10))
-        for phone in self.contact.phones:
-            self.phone_listbox.insert('end', phone)
-        self.phone_listbox.pack(side='left', fill='both', expand=True)
+        phone_list_frame = tk.Frame(phone_frame)
+        phone_list_frame.pack(side='left', fill='both', expand=True)
+        self.phone_listbox = tk.Listbox(phone_list_frame, height=4, font=('Arial', 10))
+        self.phone_listbox.insert('end', *self.contact.phones)
+        self.phone_listbox.pack(fill='both', expand=True)
+        self.phone_entry = tk.Entry(phone_list_frame, font=('Arial', 10))
+        self.phone_entry.pack(fill='x', pady=(2, 0))
+        self.phone_entry.bind('<Return>', lambda e: self.add_phone())
 
         phone_btn_frame = tk.Frame(phone_frame)
         phone_btn_frame.pack(side='right', padx=5)
@@ -1686,14 +2322,12 @@ class EditContactDialog:
         rem_phone_btn.pack(pady=2)
 
         # Addresses
-        tk.Label(main_frame, text="Addresses:", font=('Arial', 11, 'bold')).grid(row=5, column=0, sticky='nw', pady=5)
-
+        addr_label = tk.Label(main_frame, text="Addresses:", font=('Arial', 11, 'bold'))
         addr_frame = tk.Frame(main_frame)
-        addr_frame.grid(row=5, column=1, pady=5, sticky='ew')
+        rows.append((addr_label, addr_frame, 'nw'))
 
         self.addr_listbox = tk.Listbox(addr_frame, height=3, font=('Arial', 10))
-        for addr in self.contact.addresses:
-            self.addr_listbox.insert('end', addr[:60] + '...' if len(addr) > 60 else addr)
+        self.addr_listbox.insert('end', *map(_truncate_addr, self.contact.addresses))
         self.addr_listbox.pack(side='left', fill='both', expand=True)
 
         addr_btn_frame = tk.Frame(addr_frame)
@@ -1703,11 +2337,15 @@ class EditContactDialog:
         rem_addr_btn.pack(pady=2)
 
         # Notes
-        tk.Label(main_frame, text="Notes:", font=('Arial', 11, 'bold')).grid(row=6, column=0, sticky='nw', pady=5)
-
+        notes_label = tk.Label(main_frame, text="Notes:", font=('Arial', 11, 'bold'))
         self.notes_text = scrolledtext.ScrolledText(main_frame, height=6, font=('Arial', 10))
-        self.notes_text.grid(row=6, column=1, pady=5, sticky='ew')
         self.notes_text.insert('1.0', '\n---\n'.join(self.contact.notes))
+        rows.append((notes_label, self.notes_text, 'nw'))
+
+        # Single layout pass over the fully built rows
+        for row, (label, widget, anchor) in enumerate(rows):
+            label.grid(row=row, column=0, sticky=anchor, pady=5)
+            widget.grid(row=row, column=1, pady=5, sticky='ew')
 
         main_frame.columnconfigure(1, weight=1)
 
@@ -1722,17 +2360,25 @@ class EditContactDialog:
                                       bg_color='#4CAF50', font=('Arial', 11, 'bold'), width=15)
         save_btn.pack(side='right', padx=5)
 
+    def _ensure_copy(self):
+        """Swap in a private copy of the contact before the first mutation"""
+        if not self._copied:
+            self.contact = self.contact.copy()
+            self._copied = True
+
     def add_email(self):
-        """Add a new email"""
-        email = simpledialog.askstring("Add Email", "Enter email address:", parent=self.dialog)
-        if email and email.strip():
-            self.email_listbox.insert('end', email.strip())
+        """Add the email typed into the inline entry"""
+        email = self.email_entry.get().strip()
+        if email:
+            self.email_listbox.insert('end', email)
+            self.email_entry.delete(0, 'end')
 
     def add_phone(self):
-        """Add a new phone"""
-        phone = simpledialog.askstring("Add Phone", "Enter phone number:", parent=self.dialog)
-        if phone and phone.strip():
-            self.phone_listbox.insert('end', phone.strip())
+        """Add the phone typed into the inline entry"""
+        phone = self.phone_entry.get().strip()
+        if phone:
+            self.phone_listbox.insert('end', phone)
+            self.phone_entry.delete(0, 'end')
 
     def remove_email(self):
         """Remove selected email"""
@@ -1752,8 +2398,8 @@ class EditContactDialog:
         if selection:
             idx = selection[0]
             self.addr_listbox.delete(idx)
-            if idx < len(self.contact.addresses):
-                del self.contact.addresses[idx]
+            if idx < len(self._addr_indices):
+                self._removed_addrs.add(self._addr_indices.pop(idx))
 
     def cancel(self):
         """Cancel and close"""
@@ -1761,19 +2407,38 @@ class EditContactDialog:
 
     def save(self):
         """Save changes and close"""
+        self._ensure_copy()
         self.contact.fn = self.name_entry.get().strip()
         self.contact.org = self.org_entry.get().strip()
         self.contact.title = self.title_entry.get().strip()
 
-        self.contact.emails = list(self.email_listbox.get(0, 'end'))
-        self.contact.phones = list(self.phone_listbox.get(0, 'end'))
+        # Slice-assign so the listbox tuples land in the existing lists
+        # instead of allocating replacements
+        self.contact.emails[:] = self.email_listbox.get(0, 'end')
+        self.contact.phones[:] = self.phone_listbox.get(0, 'end')
+
+        if self._removed_addrs:
+            self.contact.addresses = [
+                a for i, a in enumerate(self.contact.addresses)
+                if i not in self._removed_addrs]
 
         notes_text = self.notes_text.get('1.0', 'end').strip()
         if notes_text:
-            self.contact.notes = [n.strip() for n in notes_text.split('---') if n.strip()]
+            parts = (n.strip() for n in _NOTE_SPLIT_RE.split(notes_text))
+            self.contact.notes = [p for p in parts if p]
         else:
             self.contact.notes = []
 
+        # Invalidate the caches derived from the fields just replaced
+        self.contact._full_details = None
+        self.contact._normalized_name = None
+        self.contact._parsed_name = None
+        self.contact._match_keys = None
+        self.contact._normalized_emails = None
+        self.contact._normalized_phones = None
+        self.contact._org_lc = None
+        self.contact._vcard_cache = None
+
         self.result = self.contact
         self.dialog.destroy()
 
@@ -1782,6 +2447,34 @@ class EditContactDialog:
 # MAIN APPLICATION
 # ============================================================================
 
+# Report shown after a successful export; a module-level template keeps
+# the layout out of the handler and is filled per export via format_map
+EXPORT_REPORT_TEMPLATE = """Export Complete!
+
+File: {fname}
+
+Statistics:
+- Merged contacts: {n_merged:,}
+- Unique contacts: {n_unique:,}
+- Skipped groups: {n_skipped_groups:,}
+- Skipped contacts: {n_skipped:,}
+- Total exported: {n_all:,}
+
+Original counts:
+- File 1: {n_file1:,} contacts
+- File 2: {n_file2:,} contacts
+- Combined: {n_contacts:,} contacts
+
+Reduction: {n_reduction:,} duplicates removed
+"""
+
+
+# One reusable row of the batch-review list: its widgets are created once
+# and reconfigured for whichever group occupies the row on the current page
+_ReviewRow = namedtuple('_ReviewRow', ['frame', 'cb', 'name_lbl', 'factors_lbl',
+                                       'preview_btn', 'win'])
+
+
 class MergerApp:
     """Main vCard Merger Application"""
 
@@ -1808,6 +2501,8 @@ class MergerApp:
         # File tracking
         self.file1_path = None
         self.file2_path = None
+        self._file1_basename = None
+        self._file2_basename = None
         self.file1_contacts = []
         self.file2_contacts = []
 
@@ -1818,13 +2513,40 @@ class MergerApp:
         # Batch approval
         self.confidence_batches = []
         self.current_batch_idx = 0
-        self.batch_selections = {}
+        # Per-group selection flag (1 = merge), a plain byte per group
+        # instead of a Tcl BooleanVar per row
+        self._selected_bits = bytearray()
         self.batch_review_page = 0
-        self.groups_per_batch_page = 100
+        self.groups_per_batch_page = 1000
         self.edited_merges = {}
+        self.merged_cache = {}
         self.merged_group_indices = set()
-
-        self.task_queue = queue.Queue()
+        self._merged_mask = bytearray()
+        self._contact_to_group = []
+
+        # Batch-review screen is built once and recycled across page turns;
+        # _review_rows is the pool of reusable group-row widgets
+        self._review_frame = None
+        self._review_rows = []
+        self._review_page_groups = []
+        self._review_row_h = None
+        self._review_render_pending = False
+        self._review_scrollregion = None
+        self._review_last_yset = None
+
+        # Plain deque: append/popleft are atomic under the GIL, so the
+        # worker/UI handoff needs no Queue lock per message
+        self.task_queue = deque()
+        # Progress updates are coalesced: workers overwrite this single
+        # slot and the poller renders at most the newest snapshot per tick
+        self._latest_progress = None
+        self._progress_lock = threading.Lock()
+        self._last_progress_msg = None
+        # Count of background workers in flight; drives the poll cadence
+        self._busy_workers = 0
+        # Bumped by go_home so results from workers started before a reset
+        # are recognized as stale and dropped instead of touching new state
+        self._session_gen = 0
 
         self.setup_ui()
         self.show_load_screen()
@@ -1832,32 +2554,65 @@ class MergerApp:
 
     def process_queue(self):
         """Process background thread messages"""
-        try:
-            while True:
-                msg = self.task_queue.get_nowait()
+        # Drain only what was queued when the tick started; anything a
+        # worker appends mid-drain waits for the next tick
+        task_queue = self.task_queue
+        for _ in range(len(task_queue)):
+            msg = task_queue.popleft()
+            msg_type = msg['type']
+
+            # A terminal message retires its worker even if it is stale
+            if msg_type in ('groups_found', 'merges_done', 'export_done',
+                            'error'):
+                self._busy_workers = max(0, self._busy_workers - 1)
+
+            # Results from before a go_home reset refer to state that no
+            # longer exists; drop them rather than corrupt the new session
+            if msg.get('gen', self._session_gen) != self._session_gen:
+                continue
 
-                if msg['type'] == 'progress':
-                    self.update_progress(msg['current'], msg['total'], msg['message'])
-                elif msg['type'] == 'files_loaded':
+            # One failing handler must not abort the loop before the
+            # after() below reschedules, or the pump would stop for good
+            try:
+                if msg_type == 'files_loaded':
                     self._handle_files_loaded(msg)
-                elif msg['type'] == 'groups_found':
+                elif msg_type == 'groups_found':
                     self._handle_groups_found(msg)
-                elif msg['type'] == 'error':
+                elif msg_type == 'merges_done':
+                    self._handle_merges_done(msg)
+                elif msg_type == 'export_done':
+                    self._handle_export_done(msg)
+                elif msg_type == 'error':
                     messagebox.showerror("Error", msg['message'])
                     self.status_label.config(text="Error occurred", fg='red')
-        except queue.Empty:
-            pass
-
-        self.root.after(100, self.process_queue)
+            except Exception as e:
+                print(f"Message handler error: {e}")
+                import traceback
+                traceback.print_exc()
+
+        # Render only the newest progress snapshot, at most once per tick.
+        # No explicit idle flush here: this runs inside an after() callback,
+        # so Tk repaints on the event loop's own idle pass, batching however
+        # many widget updates the tick produced into one redraw
+        with self._progress_lock:
+            progress = self._latest_progress
+            self._latest_progress = None
+        if progress is not None:
+            self.update_progress(*progress)
+
+        # Poll fast while any worker is in flight, slowly when idle
+        busy = self._busy_workers or progress is not None or task_queue
+        self.root.after(50 if busy else 500, self.process_queue)
 
     def update_progress(self, current, total, message):
         """Update progress bar and message"""
         if hasattr(self, 'progress_bar'):
             self.progress_bar['value'] = current
             self.progress_bar['maximum'] = total
-        if hasattr(self, 'progress_label'):
+        # Only push the label text through Tcl when it actually changed
+        if message != self._last_progress_msg and hasattr(self, 'progress_label'):
+            self._last_progress_msg = message
             self.progress_label.config(text=message)
-        self.root.update_idletasks()
 
     def setup_ui(self):
         """Setup main UI container"""
@@ -1880,8 +2635,16 @@ class MergerApp:
 
     def clear_main_frame(self):
         """Clear all widgets from main frame"""
+        # The batch-review screen (and its pool of row widgets) is expensive
+        # to rebuild, so it is hidden rather than destroyed
         for widget in self.main_frame.winfo_children():
-            widget.destroy()
+            if widget is self._review_frame:
+                widget.pack_forget()
+                # Drop the page's group references and neuter any render
+                # still pending on the now-hidden canvas
+                self._review_page_groups = []
+            else:
+                widget.destroy()
 
     def go_home(self):
         """Go back to home/load screen"""
@@ -1893,7 +2656,9 @@ class MergerApp:
             if not confirm:
                 return
 
-        # Reset state
+        # Reset state; in-flight workers from the old session keep running
+        # but their queued results now carry a stale generation
+        self._session_gen += 1
         self.contacts = []
         self.groups = []
         self.current_group_idx = 0
@@ -1902,10 +2667,13 @@ class MergerApp:
         self.history = []
         self.confidence_batches = []
         self.current_batch_idx = 0
-        self.batch_selections = {}
+        self._selected_bits = bytearray()
         self.batch_review_page = 0
         self.edited_merges = {}
+        self.merged_cache = {}
         self.merged_group_indices = set()
+        self._merged_mask = bytearray()
+        self._contact_to_group = []
         self.file1_contacts = []
         self.file2_contacts = []
 
@@ -2018,6 +2786,7 @@ class MergerApp:
                                   disabledforeground='white',
                                   state='disabled')
         self.load_btn.pack(pady=20, padx=50, fill='x')
+        self._load_btn_enabled = False
 
     def update_threshold(self, val):
         """Update threshold label"""
@@ -2038,7 +2807,8 @@ class MergerApp:
         )
         if path:
             self.file1_path = path
-            self.file1_label.config(text=os.path.basename(path))
+            self._file1_basename = os.path.basename(path)
+            self.file1_label.config(text=self._file1_basename)
             self.check_files_ready()
 
     def select_file2(self):
@@ -2049,63 +2819,75 @@ class MergerApp:
         )
         if path:
             self.file2_path = path
-            self.file2_label.config(text=os.path.basename(path))
+            self._file2_basename = os.path.basename(path)
+            self.file2_label.config(text=self._file2_basename)
             self.check_files_ready()
 
     def check_files_ready(self):
         """Enable load button when both files selected"""
-        if self.file1_path and self.file2_path:
+        # Only cross into Tcl on the disabled -> enabled transition
+        if not self._load_btn_enabled and self.file1_path and self.file2_path:
+            self._load_btn_enabled = True
             self.load_btn.config(state='normal')
 
     def load_and_group(self):
         """Load files and find groups in background thread"""
         self.load_btn.config(state='disabled', text="Processing...")
+        self._load_btn_enabled = False
         self.status_label.config(text="Loading files...", fg='blue')
 
-        thread = threading.Thread(target=self._load_and_group_thread)
+        self._busy_workers += 1
+        thread = threading.Thread(target=self._load_and_group_thread,
+                                  args=(self._session_gen,))
         thread.daemon = True
         thread.start()
 
-    def _load_and_group_thread(self):
+    def _load_and_group_thread(self, gen):
         """Background thread for loading and grouping"""
         try:
             def progress_callback(current, total, message):
-                self.task_queue.put({
-                    'type': 'progress',
-                    'current': current,
-                    'total': total,
-                    'message': message
-                })
-
-            progress_callback(0, 100, "Loading first file...")
-            contacts1 = parse_vcard_file(self.file1_path, os.path.basename(self.file1_path))
-
-            progress_callback(10, 100, "Loading second file...")
-            contacts2 = parse_vcard_file(self.file2_path, os.path.basename(self.file2_path))
+                # Overwrite rather than enqueue: intermediate snapshots the
+                # poller never saw carry no information worth queueing
+                with self._progress_lock:
+                    self._latest_progress = (current, total, message)
+
+            # Parse both files concurrently: each parse is dominated by
+            # file I/O and record decoding, so the two overlap well
+            progress_callback(0, 100, "Loading files...")
+            file1_name = self._file1_basename
+            file2_name = self._file2_basename
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                future1 = pool.submit(parse_vcard_file, self.file1_path, file1_name)
+                future2 = pool.submit(parse_vcard_file, self.file2_path, file2_name)
+                contacts1 = future1.result()
+                contacts2 = future2.result()
 
             all_contacts = contacts1 + contacts2
 
-            self.task_queue.put({
+            self.task_queue.append({
                 'type': 'files_loaded',
+                'gen': gen,
                 'contacts': all_contacts,
                 'contacts1': contacts1,
                 'contacts2': contacts2,
-                'file1_name': os.path.basename(self.file1_path),
-                'file2_name': os.path.basename(self.file2_path)
+                'file1_name': file1_name,
+                'file2_name': file2_name
             })
 
             progress_callback(20, 100, "Finding duplicates...")
             threshold = self.threshold_var.get()
             groups = find_similar_groups(all_contacts, threshold, progress_callback)
 
-            self.task_queue.put({
+            self.task_queue.append({
                 'type': 'groups_found',
+                'gen': gen,
                 'groups': groups
             })
 
         except Exception as e:
-            self.task_queue.put({
+            self.task_queue.append({
                 'type': 'error',
+                'gen': gen,
                 'message': f"Error loading files: {str(e)}"
             })
 
@@ -2115,32 +2897,69 @@ class MergerApp:
         self.file1_contacts = msg['contacts1']
         self.file2_contacts = msg['contacts2']
 
-        self.status_label.config(
-            text=f"Loaded {len(msg['contacts1']):,} + {len(msg['contacts2']):,} = {len(self.contacts):,} contacts",
-            fg='green'
-        )
+        # Format the counts once; the string is reused verbatim by Tk
+        loaded_text = (f"Loaded {len(self.file1_contacts):,} + "
+                       f"{len(self.file2_contacts):,} = {len(self.contacts):,} contacts")
+        self.status_label.config(text=loaded_text, fg='green')
 
     def _handle_groups_found(self, msg):
         """Handle groups found message"""
         self.groups = msg['groups']
 
-        # Create confidence batches
+        # Create confidence batches; merged_count tracks how many of a
+        # batch's groups have been merged so the overview never has to
+        # rescan merged_group_indices
         self.confidence_batches = [
-            {'name': '95-100%', 'min': 95, 'max': 100, 'groups': []},
-            {'name': '90-94%', 'min': 90, 'max': 94, 'groups': []},
-            {'name': '85-89%', 'min': 85, 'max': 89, 'groups': []},
-            {'name': '80-84%', 'min': 80, 'max': 84, 'groups': []},
-            {'name': '75-79%', 'min': 75, 'max': 79, 'groups': []},
-            {'name': '70-74%', 'min': 70, 'max': 74, 'groups': []},
-            {'name': '50-69%', 'min': 50, 'max': 69, 'groups': []},
+            {'name': '95-100%', 'min': 95, 'max': 100, 'groups': [], 'merged_count': 0},
+            {'name': '90-94%', 'min': 90, 'max': 94, 'groups': [], 'merged_count': 0},
+            {'name': '85-89%', 'min': 85, 'max': 89, 'groups': [], 'merged_count': 0},
+            {'name': '80-84%', 'min': 80, 'max': 84, 'groups': [], 'merged_count': 0},
+            {'name': '75-79%', 'min': 75, 'max': 79, 'groups': [], 'merged_count': 0},
+            {'name': '70-74%', 'min': 70, 'max': 74, 'groups': [], 'merged_count': 0},
+            {'name': '50-69%', 'min': 50, 'max': 69, 'groups': [], 'merged_count': 0},
         ]
 
+        # Confidence -> batch index lookup table: one list index per group
+        # instead of a range scan over every batch
+        conf_to_batch = [-1] * 101
+        for bi, batch in enumerate(self.confidence_batches):
+            for conf in range(batch['min'], batch['max'] + 1):
+                conf_to_batch[conf] = bi
+        self._conf_to_batch = conf_to_batch
+
+        # Every group starts selected for merging
+        self._selected_bits = bytearray(b'\x01' * len(self.groups))
+        # Merged flag per group, the branch-cheap mirror of
+        # merged_group_indices for the hot remaining/skipped filters
+        self._merged_mask = bytearray(len(self.groups))
+
+        batch_groups = [batch['groups'] for batch in self.confidence_batches]
+        # Contact index -> owning group (-1 for ungrouped), so export can
+        # classify every contact with one array lookup instead of set scans
+        contact_to_group = [-1] * len(self.contacts)
+        contacts = self.contacts
         for i, group in enumerate(self.groups):
-            conf = group['confidence']
-            for batch in self.confidence_batches:
-                if batch['min'] <= conf <= batch['max']:
-                    batch['groups'].append(i)
-                    break
+            bi = conf_to_batch[min(group['confidence'], 100)]
+            if bi >= 0:
+                batch_groups[bi].append(i)
+            indices = group['indices']
+            for idx in indices:
+                contact_to_group[idx] = i
+
+            # Pre-bake the review-row strings so scrolling and page turns
+            # never re-join names or factors
+            names = [contacts[idx].fn for idx in indices if contacts[idx].fn][:3]
+            names_text = ' | '.join(names)
+            if len(indices) > 3:
+                names_text += f' (+{len(indices)-3} more)'
+            group['_names_preview'] = names_text
+            group['_factors_short'] = (
+                f"{group['confidence']}% - {', '.join(group['match_factors'][:2])}")
+            confirm_names = ' + '.join(names)
+            if len(indices) > 3:
+                confirm_names += f" (+{len(indices)-3})"
+            group['_confirm_line'] = f"• {confirm_names} ({group['confidence']}%)"
+        self._contact_to_group = contact_to_group
 
         self.status_label.config(
             text=f"Found {len(self.groups):,} duplicate groups",
@@ -2181,9 +3000,7 @@ class MergerApp:
             if count == 0:
                 continue
 
-            # Count already merged
-            merged_count = sum(1 for g in batch['groups'] if g in self.merged_group_indices)
-            remaining = count - merged_count
+            remaining = count - batch['merged_count']
 
             btn_frame = tk.Frame(batches_frame)
             btn_frame.pack(fill='x', pady=5)
@@ -2224,118 +3041,67 @@ class MergerApp:
                                             bg_color='#4CAF50', font=('Arial', 14, 'bold'))
             export_btn.pack(fill='x')
 
-    def show_batch_review(self, batch_idx, reset_page=True):
-        """Show batch review screen for a confidence level"""
-        self.current_batch_idx = batch_idx
-        if reset_page:
-            self.batch_review_page = 0
-
-        batch = self.confidence_batches[batch_idx]
-        group_indices = [g for g in batch['groups'] if g not in self.merged_group_indices]
-
-        if not group_indices:
-            messagebox.showinfo("Complete", "All groups in this batch have been processed!")
+    def _ensure_review_screen(self):
+        """Build the persistent batch-review scaffolding on first use"""
+        if self._review_frame is not None and self._review_frame.winfo_exists():
             return
 
-        self.clear_main_frame()
+        self._review_frame = tk.Frame(self.main_frame)
+        self._review_rows = []
+        self._review_row_h = None
+        self._review_scrollregion = None
 
         # Header
-        header_frame = tk.Frame(self.main_frame, bg='#2196F3', height=60)
+        header_frame = tk.Frame(self._review_frame, bg='#2196F3', height=60)
         header_frame.pack(fill='x')
         header_frame.pack_propagate(False)
 
-        tk.Label(header_frame, text=f"Review: {batch['name']} Confidence ({len(group_indices)} groups)",
-                font=('Arial', 16, 'bold'), bg='#2196F3', fg='white').pack(pady=15)
-
-        # Pagination info
-        total_pages = (len(group_indices) + self.groups_per_batch_page - 1) // self.groups_per_batch_page
-        start_idx = self.batch_review_page * self.groups_per_batch_page
-        end_idx = min(start_idx + self.groups_per_batch_page, len(group_indices))
-        page_groups = group_indices[start_idx:end_idx]
+        self._review_header = tk.Label(header_frame, text='',
+                                       font=('Arial', 16, 'bold'), bg='#2196F3', fg='white')
+        self._review_header.pack(pady=15)
 
         # Groups list
-        list_frame = tk.Frame(self.main_frame)
+        list_frame = tk.Frame(self._review_frame)
         list_frame.pack(fill='both', expand=True, padx=20, pady=10)
 
-        # Canvas for scrolling
-        canvas = tk.Canvas(list_frame)
+        # Virtualized canvas: rows are canvas window items laid out at
+        # fixed offsets, and only those intersecting the viewport are shown
+        canvas = tk.Canvas(list_frame, highlightthickness=0)
         scrollbar = tk.Scrollbar(list_frame, orient='vertical', command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas)
-
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-
-        canvas.create_window((0, 0), window=scrollable_frame, anchor='nw')
-        canvas.configure(yscrollcommand=scrollbar.set)
-
-        # Initialize selections for this batch
-        for group_idx in page_groups:
-            if group_idx not in self.batch_selections:
-                self.batch_selections[group_idx] = tk.BooleanVar(value=True)
+        self._review_canvas = canvas
+        self._review_scrollbar = scrollbar
 
-        # Create group items
-        for group_idx in page_groups:
-            group = self.groups[group_idx]
-            contacts = [self.contacts[i] for i in group['indices']]
-
-            item_frame = tk.Frame(scrollable_frame, relief='solid', borderwidth=1, bg='white')
-            item_frame.pack(fill='x', padx=5, pady=3)
-
-            # Checkbox
-            cb = tk.Checkbutton(item_frame, variable=self.batch_selections[group_idx],
-                               bg='white')
-            cb.pack(side='left', padx=5)
-
-            # Preview button - pack FIRST (right side) before info_frame expands
-            preview_btn = create_color_button(item_frame, text="Preview",
-                                             command=lambda gi=group_idx: self.preview_group(gi),
-                                             bg_color='#2196F3', font=('Arial', 9), padx=8, pady=3)
-            preview_btn.pack(side='right', padx=5, pady=5)
-
-            # Group info - pack AFTER preview button so it fills remaining space
-            info_frame = tk.Frame(item_frame, bg='white')
-            info_frame.pack(side='left', fill='x', expand=True)
-
-            names = [c.fn for c in contacts if c.fn][:3]
-            names_text = ' | '.join(names)
-            if len(contacts) > 3:
-                names_text += f' (+{len(contacts)-3} more)'
-
-            tk.Label(info_frame, text=names_text,
-                    font=('Arial', 10, 'bold'), bg='white', anchor='w').pack(fill='x')
-
-            factors_text = ', '.join(group['match_factors'][:2])
-            tk.Label(info_frame, text=f"{group['confidence']}% - {factors_text}",
-                    font=('Arial', 9), fg='gray', bg='white', anchor='w').pack(fill='x')
+        canvas.configure(yscrollcommand=self._review_on_yset)
+        canvas.bind('<Configure>', lambda e: self._schedule_render())
+        canvas.bind('<MouseWheel>',
+                    lambda e: canvas.yview_scroll(-e.delta // 120, 'units'))
+        canvas.bind('<Button-4>', lambda e: canvas.yview_scroll(-1, 'units'))
+        canvas.bind('<Button-5>', lambda e: canvas.yview_scroll(1, 'units'))
 
         canvas.pack(side='left', fill='both', expand=True)
         scrollbar.pack(side='right', fill='y')
 
-        # Pagination controls
-        if total_pages > 1:
-            page_frame = tk.Frame(self.main_frame)
-            page_frame.pack(fill='x', padx=20, pady=5)
+        # Pagination controls (shown only when there is more than one page)
+        self._review_page_frame = tk.Frame(self._review_frame)
 
-            if self.batch_review_page > 0:
-                prev_btn = create_color_button(page_frame, text="< Previous",
-                                              command=self._go_prev_page,
-                                              bg_color='#2196F3', font=('Arial', 10))
-                prev_btn.pack(side='left', padx=5)
+        self._review_prev_btn = create_color_button(self._review_page_frame, text="< Previous",
+                                                    command=self._go_prev_page,
+                                                    bg_color='#2196F3', font=('Arial', 10))
+        self._review_prev_btn.pack(side='left', padx=5)
 
-            tk.Label(page_frame, text=f"Page {self.batch_review_page + 1} of {total_pages}",
-                    font=('Arial', 10)).pack(side='left', padx=20)
+        self._review_page_label = tk.Label(self._review_page_frame, text='',
+                                           font=('Arial', 10))
+        self._review_page_label.pack(side='left', padx=20)
 
-            if self.batch_review_page < total_pages - 1:
-                next_btn = create_color_button(page_frame, text="Next >",
-                                              command=self._go_next_page,
-                                              bg_color='#2196F3', font=('Arial', 10))
-                next_btn.pack(side='left', padx=5)
+        self._review_next_btn = create_color_button(self._review_page_frame, text="Next >",
+                                                    command=self._go_next_page,
+                                                    bg_color='#2196F3', font=('Arial', 10))
+        self._review_next_btn.pack(side='left', padx=5)
 
-        # Action buttons
-        btn_frame = tk.Frame(self.main_frame, bg='#f0f0f0')
+        # Action buttons act on whatever page is currently displayed
+        btn_frame = tk.Frame(self._review_frame, bg='#f0f0f0')
         btn_frame.pack(fill='x', padx=20, pady=15)
+        self._review_btn_frame = btn_frame
 
         back_btn = create_color_button(btn_frame, text="Back to Overview",
                                        command=self.show_batch_overview,
@@ -2343,20 +3109,180 @@ class MergerApp:
         back_btn.pack(side='left', padx=5)
 
         select_all_btn = create_color_button(btn_frame, text="Select All",
-                                            command=lambda: self._select_all_batch(page_groups, True),
+                                            command=lambda: self._select_all_batch(self._review_page_groups, True),
                                             bg_color='#2196F3', font=('Arial', 11), width=12)
         select_all_btn.pack(side='left', padx=5)
 
         select_none_btn = create_color_button(btn_frame, text="Select None",
-                                             command=lambda: self._select_all_batch(page_groups, False),
+                                             command=lambda: self._select_all_batch(self._review_page_groups, False),
                                              bg_color='#757575', font=('Arial', 11), width=12)
         select_none_btn.pack(side='left', padx=5)
 
         merge_btn = create_color_button(btn_frame, text="Merge Selected",
-                                        command=lambda: self._merge_selected_batch(page_groups),
+                                        command=lambda: self._merge_selected_batch(self._review_page_groups),
                                         bg_color='#4CAF50', font=('Arial', 12, 'bold'), width=20)
         merge_btn.pack(side='right', padx=5)
 
+    def _make_review_row(self):
+        """Create one pooled group row for the batch-review list"""
+        item_frame = tk.Frame(self._review_canvas, relief='solid', borderwidth=1, bg='white')
+        # Callbacks read the row's current group off this attribute, so the
+        # closures below are created once per pooled row rather than once
+        # per row per page turn
+        item_frame._group_idx = -1
+
+        # Checkbox
+        cb = tk.Checkbutton(item_frame, bg='white',
+                            command=lambda f=item_frame: self._toggle_selected(f._group_idx))
+        cb.pack(side='left', padx=5)
+
+        # Preview button - pack FIRST (right side) before info_frame expands
+        preview_btn = create_color_button(item_frame, text="Preview",
+                                          command=lambda f=item_frame: self.preview_group(f._group_idx),
+                                          bg_color='#2196F3', font=('Arial', 9), padx=8, pady=3)
+        preview_btn.pack(side='right', padx=5, pady=5)
+
+        # Group info - pack AFTER preview button so it fills remaining space
+        info_frame = tk.Frame(item_frame, bg='white')
+        info_frame.pack(side='left', fill='x', expand=True)
+
+        name_lbl = tk.Label(info_frame, text='',
+                            font=('Arial', 10, 'bold'), bg='white', anchor='w')
+        name_lbl.pack(fill='x')
+
+        factors_lbl = tk.Label(info_frame, text='',
+                               font=('Arial', 9), fg='gray', bg='white', anchor='w')
+        factors_lbl.pack(fill='x')
+
+        win = self._review_canvas.create_window(5, 0, window=item_frame,
+                                                anchor='nw', state='hidden')
+        return _ReviewRow(item_frame, cb, name_lbl, factors_lbl, preview_btn, win)
+
+    def _config_row(self, row, group_idx):
+        """Point a pooled row at the given group"""
+        group = self.groups[group_idx]
+
+        row.frame._group_idx = group_idx
+        if self._selected_bits[group_idx]:
+            row.cb.select()
+        else:
+            row.cb.deselect()
+        row.name_lbl.config(text=group['_names_preview'])
+        row.factors_lbl.config(text=group['_factors_short'])
+
+    def _review_on_yset(self, first, last):
+        """Forward scroll fractions to the scrollbar and re-render"""
+        self._review_scrollbar.set(first, last)
+        # Tk re-fires yscrollcommand after scrollregion configures too;
+        # only a changed view fraction means the viewport actually moved
+        if (first, last) != self._review_last_yset:
+            self._review_last_yset = (first, last)
+            self._schedule_render()
+
+    def _schedule_render(self):
+        """Debounce viewport renders to one per idle pass"""
+        if not self._review_render_pending:
+            self._review_render_pending = True
+            self._review_canvas.after_idle(self._render_visible)
+
+    def _render_visible(self):
+        """Show pooled rows for the groups currently in the viewport"""
+        self._review_render_pending = False
+        page_groups = self._review_page_groups
+        canvas = self._review_canvas
+        if not page_groups or not canvas.winfo_exists():
+            return
+
+        rows = self._review_rows
+        if not rows:
+            rows.append(self._make_review_row())
+
+        if self._review_row_h is None:
+            # Measure once from a configured row; all rows are uniform
+            self._config_row(rows[0], page_groups[0])
+            canvas.update_idletasks()
+            self._review_row_h = rows[0].frame.winfo_reqheight() + 6
+        row_h = self._review_row_h
+
+        scrollregion = (0, 0, 0, row_h * len(page_groups))
+        if scrollregion != self._review_scrollregion:
+            self._review_scrollregion = scrollregion
+            canvas.configure(scrollregion=scrollregion)
+
+        top = canvas.canvasy(0)
+        view_h = canvas.winfo_height()
+        first = max(0, int(top // row_h))
+        last = min(len(page_groups), int((top + view_h) // row_h) + 2)
+        visible = range(first, last)
+
+        while len(rows) < len(visible):
+            rows.append(self._make_review_row())
+
+        width = max(canvas.winfo_width() - 10, 200)
+        for row, vis_idx in zip(rows, visible):
+            self._config_row(row, page_groups[vis_idx])
+            canvas.coords(row.win, 5, vis_idx * row_h)
+            canvas.itemconfigure(row.win, state='normal', width=width)
+        for row in rows[len(visible):]:
+            canvas.itemconfigure(row.win, state='hidden')
+
+    def show_batch_review(self, batch_idx, reset_page=True):
+        """Show batch review screen for a confidence level"""
+        self.current_batch_idx = batch_idx
+        if reset_page:
+            self.batch_review_page = 0
+
+        batch = self.confidence_batches[batch_idx]
+        merged_mask = self._merged_mask
+        group_indices = [g for g in batch['groups'] if not merged_mask[g]]
+
+        if not group_indices:
+            messagebox.showinfo("Complete", "All groups in this batch have been processed!")
+            return
+
+        self.clear_main_frame()
+        self._ensure_review_screen()
+        self._review_frame.pack(fill='both', expand=True)
+
+        self._review_header.config(
+            text=f"Review: {batch['name']} Confidence ({len(group_indices)} groups)")
+
+        # Pagination info
+        total_pages = (len(group_indices) + self.groups_per_batch_page - 1) // self.groups_per_batch_page
+        # Merges can shrink the group list, so clamp the page into range
+        self.batch_review_page = min(max(self.batch_review_page, 0),
+                                     total_pages - 1)
+        start_idx = self.batch_review_page * self.groups_per_batch_page
+        end_idx = min(start_idx + self.groups_per_batch_page, len(group_indices))
+        page_groups = group_indices[start_idx:end_idx]
+        self._review_page_groups = page_groups
+
+        # Off-screen rows are never realised, so the page size costs
+        # nothing beyond the scrollregion arithmetic
+        self._review_canvas.yview_moveto(0)
+        self._schedule_render()
+
+        # Pagination controls. The pseudo-buttons are Frame+Label pairs
+        # with <Button-1> bindings, so there is no state= to disable;
+        # as in the original per-page build, a button is simply not shown
+        # when its direction is invalid
+        if total_pages > 1:
+            self._review_page_label.config(
+                text=f"Page {self.batch_review_page + 1} of {total_pages}")
+            if self.batch_review_page > 0:
+                self._review_prev_btn.pack(side='left', padx=5,
+                                           before=self._review_page_label)
+            else:
+                self._review_prev_btn.pack_forget()
+            if self.batch_review_page < total_pages - 1:
+                self._review_next_btn.pack(side='left', padx=5)
+            else:
+                self._review_next_btn.pack_forget()
+            self._review_page_frame.pack(fill='x', padx=20, pady=5,
+                                         before=self._review_btn_frame)
+        else:
+            self._review_page_frame.pack_forget()
+
     def _batch_page_change(self, delta, batch_idx):
         """Change batch review page"""
         self.batch_review_page += delta
@@ -2370,38 +3296,33 @@ class MergerApp:
         """Go to previous page of batch review"""
         self._batch_page_change(-1, self.current_batch_idx)
 
+    def _toggle_selected(self, group_idx):
+        """Flip a group's selection bit from its checkbox"""
+        self._selected_bits[group_idx] ^= 1
+
     def _select_all_batch(self, group_indices, select):
         """Select or deselect all groups in batch"""
+        bit = 1 if select else 0
         for idx in group_indices:
-            self.batch_selections[idx].set(select)
+            self._selected_bits[idx] = bit
+        # Re-render so visible checkboxes pick up the new bits
+        self._schedule_render()
 
     def _merge_selected_batch(self, page_groups):
         """Merge all selected groups in the current page"""
-        selected = [idx for idx in page_groups if self.batch_selections.get(idx, tk.BooleanVar()).get()]
+        selected = [idx for idx in page_groups if self._selected_bits[idx]]
 
         if not selected:
             messagebox.showwarning("No Selection", "Please select at least one group to merge.")
             return
 
-        # Build summary of what will be merged
-        summary_lines = []
-        total_contacts = 0
-        for i, group_idx in enumerate(selected[:10]):  # Show first 10
-            group = self.groups[group_idx]
-            contacts = [self.contacts[idx] for idx in group['indices']]
-            total_contacts += len(contacts)
-            names = [c.fn for c in contacts if c.fn][:3]
-            names_str = " + ".join(names)
-            if len(contacts) > 3:
-                names_str += f" (+{len(contacts)-3})"
-            summary_lines.append(f"• {names_str} ({group['confidence']}%)")
+        # Build summary of what will be merged from the pre-baked lines
+        groups = self.groups
+        summary_lines = [groups[gi]['_confirm_line'] for gi in selected[:10]]
+        total_contacts = sum(len(groups[gi]['indices']) for gi in selected)
 
         if len(selected) > 10:
-            remaining = len(selected) - 10
-            for group_idx in selected[10:]:
-                group = self.groups[group_idx]
-                total_contacts += len(group['indices'])
-            summary_lines.append(f"\n...and {remaining} more groups")
+            summary_lines.append(f"\n...and {len(selected) - 10} more groups")
 
         summary = "\n".join(summary_lines)
         summary += f"\n\nTotal: {total_contacts} contacts → {len(selected)} merged contacts"
@@ -2415,34 +3336,90 @@ class MergerApp:
         if not result:
             return
 
-        for group_idx in selected:
-            group = self.groups[group_idx]
-            contacts = [self.contacts[i] for i in group['indices']]
+        self._start_batch_merge(selected, self.current_batch_idx)
 
-            # Use edited merge if available
-            if group_idx in self.edited_merges:
-                merged = self.edited_merges[group_idx]
-            else:
-                merged = merge_contacts(contacts)
+    def _start_batch_merge(self, selected, batch_idx):
+        """Merge the given groups in a background thread"""
+        self.status_label.config(text=f"Merging {len(selected):,} groups...", fg='blue')
+        self._busy_workers += 1
+        thread = threading.Thread(target=self._merge_worker,
+                                  args=(selected, batch_idx,
+                                        self._session_gen))
+        thread.daemon = True
+        thread.start()
+
+    def _merge_worker(self, selected, batch_idx, gen):
+        """Background thread running the merge loop for a batch"""
+        try:
+            merged_items = []
+            total = len(selected)
+            # Bind the hot lookups to locals for the duration of the loop
+            edited_get = self.edited_merges.get
+            cache = self.merged_cache
+            cache_get = cache.get
+            groups = self.groups
+            contacts = self.contacts
+            append = merged_items.append
+            for done, group_idx in enumerate(selected, 1):
+                # Edited merge wins; otherwise reuse the automatic merge the
+                # preview dialog may already have computed and cache our own
+                merged = edited_get(group_idx)
+                if merged is None:
+                    merged = cache_get(group_idx)
+                    if merged is None:
+                        group = groups[group_idx]
+                        merged = merge_contacts([contacts[i] for i in group['indices']])
+                        cache[group_idx] = merged
+                append(merged)
+
+                if done % 50 == 0:
+                    with self._progress_lock:
+                        self._latest_progress = (
+                            done, total, f"Merged {done:,} of {total:,} groups...")
+
+            self.task_queue.append({
+                'type': 'merges_done',
+                'gen': gen,
+                'items': merged_items,
+                'indices': selected,
+                'batch_idx': batch_idx
+            })
+
+        except Exception as e:
+            self.task_queue.append({
+                'type': 'error',
+                'gen': gen,
+                'message': f"Error merging groups: {str(e)}"
+            })
+
+    def _handle_merges_done(self, msg):
+        """Fold a worker's merge results into app state and move on"""
+        selected = msg['indices']
+        self.merged_contacts.extend(msg['items'])
+        self.merged_group_indices.update(selected)
+        merged_mask = self._merged_mask
+        for group_idx in selected:
+            merged_mask[group_idx] = 1
 
-            self.merged_contacts.append(merged)
-            self.merged_group_indices.add(group_idx)
+        batch = self.confidence_batches[msg['batch_idx']]
+        batch['merged_count'] += len(selected)
 
+        self.status_label.config(text=f"Merged {len(selected):,} groups", fg='green')
         messagebox.showinfo("Merged", f"Successfully merged {len(selected)} groups!")
 
         # Check if more groups in batch
-        batch = self.confidence_batches[self.current_batch_idx]
-        remaining = [g for g in batch['groups'] if g not in self.merged_group_indices]
+        remaining = [g for g in batch['groups'] if not merged_mask[g]]
 
         if remaining:
-            self.show_batch_review(self.current_batch_idx)
+            self.show_batch_review(msg['batch_idx'])
         else:
             self.show_batch_overview()
 
     def approve_entire_batch(self, batch_idx):
         """Approve and merge all groups in a confidence batch without individual review"""
         batch = self.confidence_batches[batch_idx]
-        groups_to_merge = [g for g in batch['groups'] if g not in self.merged_group_indices]
+        merged_mask = self._merged_mask
+        groups_to_merge = [g for g in batch['groups'] if not merged_mask[g]]
 
         if not groups_to_merge:
             messagebox.showinfo("Already Complete", "All groups in this batch have been merged.")
@@ -2455,21 +3432,7 @@ class MergerApp:
         )
 
         if result:
-            for group_idx in groups_to_merge:
-                group = self.groups[group_idx]
-                contacts = [self.contacts[i] for i in group['indices']]
-
-                # Use edited merge if available
-                if group_idx in self.edited_merges:
-                    merged = self.edited_merges[group_idx]
-                else:
-                    merged = merge_contacts(contacts)
-
-                self.merged_contacts.append(merged)
-                self.merged_group_indices.add(group_idx)
-
-            messagebox.showinfo("Success", f"Merged {len(groups_to_merge)} groups.")
-            self.show_batch_overview()  # Refresh to show updated counts
+            self._start_batch_merge(groups_to_merge, batch_idx)
 
     def preview_group(self, group_idx):
         """Preview a group merge"""
@@ -2486,26 +3449,8 @@ class MergerApp:
 
     def export_contacts(self):
         """Export merged and unique contacts"""
-        # Get indices of all contacts in groups
-        grouped_indices = set()
-        for group in self.groups:
-            grouped_indices.update(group['indices'])
-
-        # Get unique contacts (not in any group)
-        unique_contacts = [c for i, c in enumerate(self.contacts) if i not in grouped_indices]
-
-        # Get skipped group contacts
-        skipped_contacts = []
-        for group_idx in range(len(self.groups)):
-            if group_idx not in self.merged_group_indices:
-                group = self.groups[group_idx]
-                for idx in group['indices']:
-                    skipped_contacts.append(self.contacts[idx])
-
-        # All contacts to export
-        all_contacts = self.merged_contacts + unique_contacts + skipped_contacts
-
-        # Ask for save location
+        # Ask for the save location first: if the user cancels the dialog
+        # we bail out before doing any classification work at all
         filepath = filedialog.asksaveasfilename(
             title="Save Merged Contacts",
             defaultextension=".vcf",
@@ -2515,33 +3460,116 @@ class MergerApp:
         if not filepath:
             return
 
-        # Write vCards
-        with open(filepath, 'w', encoding='utf-8') as f:
-            for contact in all_contacts:
-                f.write(contact.to_vcard())
-                f.write('\n\n')
+        # One pass over the contacts: the group-ownership array classifies
+        # each as unique (no group) or skipped (group never merged)
+        contact_to_group = self._contact_to_group
+        merged_mask = self._merged_mask
+        unique_contacts = []
+        skipped_contacts = []
+        unique_append = unique_contacts.append
+        skipped_append = skipped_contacts.append
+        for i, contact in enumerate(self.contacts):
+            group_idx = contact_to_group[i]
+            if group_idx < 0:
+                unique_append(contact)
+            elif not merged_mask[group_idx]:
+                skipped_append(contact)
 
-        # Show report
-        report = f"""Export Complete!
+        # All contacts to export
+        all_contacts = self.merged_contacts + unique_contacts + skipped_contacts
 
-File: {os.path.basename(filepath)}
+        # Build the report up front; the worker only writes the file.
+        # Each count is computed exactly once into the stats mapping
+        n_all = len(all_contacts)
+        n_contacts = len(self.contacts)
+        report = EXPORT_REPORT_TEMPLATE.format_map({
+            'fname': os.path.basename(filepath),
+            'n_merged': len(self.merged_contacts),
+            'n_unique': len(unique_contacts),
+            'n_skipped_groups': len(self.groups) - len(self.merged_group_indices),
+            'n_skipped': len(skipped_contacts),
+            'n_all': n_all,
+            'n_file1': len(self.file1_contacts),
+            'n_file2': len(self.file2_contacts),
+            'n_contacts': n_contacts,
+            'n_reduction': n_contacts - n_all,
+        })
 
-Statistics:
-- Merged contacts: {len(self.merged_contacts):,}
-- Unique contacts: {len(unique_contacts):,}
-- Skipped groups: {len(self.groups) - len(self.merged_group_indices):,}
-- Skipped contacts: {len(skipped_contacts):,}
-- Total exported: {len(all_contacts):,}
+        self.status_label.config(
+            text=f"Exporting {n_all:,} contacts...", fg='blue')
+        self._busy_workers += 1
+        thread = threading.Thread(target=self._export_worker,
+                                  args=(filepath, all_contacts, report,
+                                        self._session_gen))
+        thread.daemon = True
+        thread.start()
 
-Original counts:
-- File 1: {len(self.file1_contacts):,} contacts
-- File 2: {len(self.file2_contacts):,} contacts
-- Combined: {len(self.contacts):,} contacts
+    def _export_worker(self, filepath, all_contacts, report, gen):
+        """Background thread writing the export file.
 
-Reduction: {len(self.contacts) - len(all_contacts):,} duplicates removed
-"""
+        all_contacts and report are snapshots materialized on the Tk
+        thread before start, so the worker never reads mutable app state.
+        """
+        try:
+            total = len(all_contacts)
+            pool = None
+
+            # Binary mode skips the text wrapper's incremental codec (and
+            # any platform newline translation). The reusable bytearray
+            # hands the buffered layer ~1 MiB blocks, which it passes
+            # through without copying; unlike a raw buffering=0 handle it
+            # also guarantees each write is complete-or-error rather than
+            # possibly partial.
+            # No fsync: the app has never promised durability beyond the
+            # OS cache, and a sync barrier would stall the close
+            # Large exports serialize on a small thread pool while this
+            # thread drains the (order-preserving) map into the buffer,
+            # overlapping string building with the write syscalls
+            try:
+                if total >= PARALLEL_EXPORT_MIN_CONTACTS:
+                    pool = ThreadPoolExecutor(max_workers=4)
+                    cards = pool.map(VCardContact.to_vcard, all_contacts,
+                                     chunksize=256)
+                else:
+                    cards = map(VCardContact.to_vcard, all_contacts)
+
+                with open(filepath, 'wb') as f:
+                    buf = bytearray()
+                    for done, vcard in enumerate(cards, 1):
+                        # Separator rides along in the card's chunk: one
+                        # buffer append per contact instead of two
+                        buf += (vcard + '\n\n').encode('utf-8')
+                        if len(buf) >= (1 << 20):
+                            f.write(buf)
+                            buf.clear()
+
+                        if done % 500 == 0:
+                            with self._progress_lock:
+                                self._latest_progress = (
+                                    done, total,
+                                    f"Exported {done:,} of {total:,} contacts...")
+
+                    if buf:
+                        f.write(buf)
+            finally:
+                if pool is not None:
+                    pool.shutdown()
+
+        except Exception as e:
+            self.task_queue.append({
+                'type': 'error',
+                'gen': gen,
+                'message': f"Error writing export file: {str(e)}"
+            })
+            return
+
+        self.task_queue.append({'type': 'export_done', 'gen': gen,
+                                'report': report})
 
-        messagebox.showinfo("Export Complete", report)
+    def _handle_export_done(self, msg):
+        """Show the export report once the worker has finished writing"""
+        self.status_label.config(text="Export complete", fg='green')
+        messagebox.showinfo("Export Complete", msg['report'])
 
 
 # ============================================================================